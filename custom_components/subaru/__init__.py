@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from datetime import datetime
 import logging
-import pprint
+import random
 
 from subarulink import Controller as SubaruAPI, InvalidCredentials, SubaruException
 from subarulink.const import COUNTRY_USA
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -19,53 +20,130 @@ from homeassistant.const import (
     STATE_ON,
     Platform,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import aiohttp_client, entity_registry as er
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryNotReady,
+    HomeAssistantError,
+)
+from homeassistant.helpers import (
+    aiohttp_client,
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from .const import (
+    ATTR_COMMAND,
+    ATTR_COMMANDS,
+    ATTR_DOOR,
+    ATTR_PRESET,
+    COMMAND_STATE_IDLE,
+    CONF_COMMAND_TIMEOUT,
+    CONF_COMMAND_TIMEOUTS,
     CONF_COUNTRY,
     CONF_POLLING_OPTION,
-    COORDINATOR_NAME,
+    CONF_RATE_LIMIT_CAPACITY,
+    CONF_RATE_LIMIT_REFILL,
+    DATA_RATE_LIMITERS,
+    DEFAULT_RATE_LIMIT_CAPACITY,
+    DEFAULT_RATE_LIMIT_REFILL,
     DOMAIN,
+    ENTRY_COMMAND_LOCKS,
+    ENTRY_COMMAND_STATUS,
     ENTRY_CONTROLLER,
     ENTRY_COORDINATOR,
+    ENTRY_PLATFORMS,
+    ENTRY_RATE_LIMITER,
     ENTRY_VEHICLES,
     FETCH_INTERVAL,
     PLATFORMS,
+    REMOTE_SERVICE_REMOTE_START,
+    REMOTE_SERVICE_UNLOCK,
+    RUN_COMMANDS_VALID_COMMANDS,
+    SERVICE_RUN_COMMANDS,
+    STARTUP_JITTER,
+    STARTUP_STAGGER,
+    UNLOCK_DOOR_ALL,
+    UNLOCK_VALID_DOORS,
     UPDATE_INTERVAL,
     UPDATE_INTERVAL_CHARGING,
-    VEHICLE_API_GEN,
-    VEHICLE_HAS_EV,
-    VEHICLE_HAS_LOCK_STATUS,
-    VEHICLE_HAS_POWER_WINDOWS,
-    VEHICLE_HAS_REMOTE_SERVICE,
-    VEHICLE_HAS_REMOTE_START,
-    VEHICLE_HAS_SAFETY_SERVICE,
-    VEHICLE_HAS_SUNROOF,
-    VEHICLE_HAS_TPMS,
-    VEHICLE_LAST_FETCH,
-    VEHICLE_LAST_UPDATE,
-    VEHICLE_MODEL_NAME,
-    VEHICLE_MODEL_YEAR,
-    VEHICLE_NAME,
-    VEHICLE_VIN,
 )
-from .migrate import async_migrate_entries
+from .coordinator import SubaruDataUpdateCoordinator
+from .device import forget_device_info
 from .options import PollingOptions
-from .remote_service import poll_subaru, refresh_subaru
+from .rate_limiter import RateLimiter
+from .remote_service import async_run_remote_commands, poll_subaru, refresh_subaru
+from .store import SelectedPresetStore
+from .vehicle import VehicleInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+RUN_COMMANDS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.string,
+        vol.Required(ATTR_COMMANDS): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1),
+            [
+                {
+                    vol.Required(ATTR_COMMAND): vol.In(RUN_COMMANDS_VALID_COMMANDS),
+                    vol.Optional(ATTR_DOOR): vol.In(UNLOCK_VALID_DOORS),
+                    vol.Optional(ATTR_PRESET): cv.string,
+                }
+            ],
+        ),
+    }
+)
+
 
 async def async_setup(hass: HomeAssistant, base_config: ConfigType) -> bool:
-    """Do nothing since this integration does not support configuration.yml setup."""
+    """Register integration services; configuration.yml setup is not supported."""
     hass.data.setdefault(DOMAIN, {})
+
+    async def async_run_commands(call: ServiceCall) -> None:
+        await _async_run_commands(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_RUN_COMMANDS, async_run_commands, schema=RUN_COMMANDS_SCHEMA
+    )
     return True
 
 
+async def _async_run_commands(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Send an ordered list of commands to the vehicle of the selected device."""
+    device_id = call.data[CONF_DEVICE_ID]
+    vin = None
+    if device := dr.async_get(hass).async_get(device_id):
+        vin = next(
+            (value for domain, value in device.identifiers if domain == DOMAIN), None
+        )
+    for entry_id, entry in hass.data[DOMAIN].items():
+        if vin in entry[ENTRY_VEHICLES]:
+            break
+    else:
+        raise HomeAssistantError(f"Device {device_id} is not a Subaru vehicle")
+
+    vehicle_info = entry[ENTRY_VEHICLES][vin]
+    coordinator = entry[ENTRY_COORDINATOR]
+    commands = []
+    for step in call.data[ATTR_COMMANDS]:
+        cmd = step[ATTR_COMMAND]
+        arg = None
+        if cmd == REMOTE_SERVICE_UNLOCK:
+            arg = UNLOCK_VALID_DOORS[step.get(ATTR_DOOR, UNLOCK_DOOR_ALL)]
+        elif cmd == REMOTE_SERVICE_REMOTE_START:
+            arg = step.get(ATTR_PRESET) or coordinator.get_selected_preset(vin)
+        commands.append((cmd, arg))
+
+    await async_run_remote_commands(
+        hass, hass.config_entries.async_get_entry(entry_id), vehicle_info, commands
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Subaru from a config entry."""
     config = entry.data
@@ -77,6 +155,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         country = COUNTRY_USA
 
     vehicles = {}
+    rate_limiter = _async_get_rate_limiter(hass, entry)
 
     try:
         controller = SubaruAPI(
@@ -91,6 +170,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             fetch_interval=FETCH_INTERVAL,
         )
         _LOGGER.debug("Using subarulink %s", controller.version)
+        await rate_limiter.async_acquire()
         await controller.connect()
 
         if not controller.device_registered:
@@ -100,7 +180,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         for vin in controller.get_vehicles():
             if controller.get_subscription_status(vin):
-                vehicles[vin] = await _get_vehicle_info(controller, vin)
+                vehicles[vin] = await _get_vehicle_info(controller, rate_limiter, vin)
 
     except InvalidCredentials as err:
         raise ConfigEntryAuthFailed(err.message) from err
@@ -110,29 +190,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     async def async_update_data() -> dict:
         """Fetch data from API endpoint."""
         try:
-            return await _refresh_subaru_data(hass, entry, vehicles, controller)
+            return await _refresh_subaru_data(
+                hass, entry, vehicles, controller, rate_limiter
+            )
         except SubaruException as err:
             raise UpdateFailed(err.message) from err
 
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=COORDINATOR_NAME,
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=FETCH_INTERVAL),
-    )
+    presets = SelectedPresetStore(hass, entry.entry_id)
+    await presets.async_load()
+    coordinator = SubaruDataUpdateCoordinator(hass, async_update_data, presets)
+
+    if delay := _async_startup_delay(hass, entry):
+        _LOGGER.debug("Delaying first refresh by %.1f seconds", delay)
+        # Entities are unavailable until the delayed refresh reports data
+        coordinator.data = {}
+        coordinator.last_update_success = False
 
-    await coordinator.async_refresh()
+        async def async_first_refresh(_: datetime) -> None:
+            await coordinator.async_refresh()
 
+        entry.async_on_unload(async_call_later(hass, delay, async_first_refresh))
+    else:
+        await coordinator.async_refresh()
+
+    platforms = _vehicle_platforms(vehicles)
     hass.data.get(DOMAIN)[entry.entry_id] = {
         ENTRY_CONTROLLER: controller,
         ENTRY_COORDINATOR: coordinator,
+        ENTRY_RATE_LIMITER: rate_limiter,
         ENTRY_VEHICLES: vehicles,
+        ENTRY_PLATFORMS: platforms,
+        ENTRY_COMMAND_LOCKS: {vin: asyncio.Lock() for vin in vehicles},
+        ENTRY_COMMAND_STATUS: {
+            vin: {"state": COMMAND_STATE_IDLE, "command": None, "message": None}
+            for vin in vehicles
+        },
     }
 
-    await async_migrate_entries(hass, entry)
+    entry.async_on_unload(entry.add_update_listener(_async_update_options))
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
 
     return True
 
@@ -143,21 +240,115 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await asyncio.gather(
             *[
                 hass.config_entries.async_forward_entry_unload(entry, component)
-                for component in PLATFORMS
+                for component in hass.data[DOMAIN][entry.entry_id][ENTRY_PLATFORMS]
             ]
         )
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        vehicles = hass.data[DOMAIN].pop(entry.entry_id)[ENTRY_VEHICLES]
+        forget_device_info(vehicles.values())
 
     return unload_ok
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate a config entry and its entities from an older version."""
+    if entry.version > 1:
+        return False
+    if entry.minor_version < 2:
+        _LOGGER.debug("Migrating %s to version 1.2", entry.title)
+        from .migrate import (  # pylint: disable=import-outside-toplevel
+            async_migrate_entries,
+        )
+
+        await async_migrate_entries(hass, entry)
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+    if entry.minor_version < 3:
+        _LOGGER.debug("Migrating %s to version 1.3", entry.title)
+        options = dict(entry.options)
+        if (timeout := options.pop(CONF_COMMAND_TIMEOUT, None)) is not None:
+            options.update(dict.fromkeys(CONF_COMMAND_TIMEOUTS, timeout))
+        hass.config_entries.async_update_entry(
+            entry, options=options, minor_version=3
+        )
+    return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the climate presets selected for the entry's vehicles."""
+    await SelectedPresetStore(hass, entry.entry_id).async_remove()
+    hass.data.get(DATA_RATE_LIMITERS, {}).pop(entry.entry_id, None)
+
+
+@callback
+def _async_get_rate_limiter(hass: HomeAssistant, entry: ConfigEntry) -> RateLimiter:
+    """
+    Return the entry's rate limiter with its configured limits.
+
+    The limiter outlives reloads of the entry, so the calls made while setting
+    it up again still count against the tokens already used.
+    """
+    capacity = entry.options.get(CONF_RATE_LIMIT_CAPACITY, DEFAULT_RATE_LIMIT_CAPACITY)
+    refill = entry.options.get(CONF_RATE_LIMIT_REFILL, DEFAULT_RATE_LIMIT_REFILL)
+    rate_limiters: dict[str, RateLimiter] = hass.data.setdefault(DATA_RATE_LIMITERS, {})
+    if rate_limiter := rate_limiters.get(entry.entry_id):
+        rate_limiter.set_limits(capacity, refill)
+    else:
+        rate_limiter = rate_limiters[entry.entry_id] = RateLimiter(capacity, refill)
+    return rate_limiter
+
+
+@callback
+def _async_startup_delay(hass: HomeAssistant, entry: ConfigEntry) -> float:
+    """
+    Return how long to delay the first refresh while Home Assistant boots.
+
+    With several accounts configured, each entry's first refresh is offset by
+    its position plus random jitter, so the vehicle data fetches do not all
+    hit the MySubaru API at once. Setup itself is not held up: the entry loads
+    and its entities wait for the delayed refresh. Setups after boot are not
+    delayed.
+    """
+    if hass.is_running:
+        return 0
+    entries = hass.config_entries.async_entries(
+        DOMAIN, include_ignore=False, include_disabled=False
+    )
+    index = next((i for i, other in enumerate(entries) if other is entry), 0)
+    if index == 0:
+        return 0
+    return index * STARTUP_STAGGER + random.uniform(0, STARTUP_JITTER)
+
+
+def _vehicle_platforms(vehicles: dict[str, VehicleInfo]) -> list[Platform]:
+    """Return the platforms that have entities for at least one vehicle."""
+    remote_service = any(info.has_remote_service for info in vehicles.values())
+    climate = any(info.has_remote_start or info.has_ev for info in vehicles.values())
+    return [
+        platform
+        for platform in PLATFORMS
+        if platform in (Platform.BINARY_SENSOR, Platform.SENSOR)
+        or (platform == Platform.SELECT and climate)
+        or (platform != Platform.SELECT and remote_service)
+    ]
+
+
+async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options that are not read on demand."""
+    rate_limiter: RateLimiter = hass.data[DOMAIN][entry.entry_id][ENTRY_RATE_LIMITER]
+    rate_limiter.set_limits(
+        entry.options.get(CONF_RATE_LIMIT_CAPACITY, DEFAULT_RATE_LIMIT_CAPACITY),
+        entry.options.get(CONF_RATE_LIMIT_REFILL, DEFAULT_RATE_LIMIT_REFILL),
+    )
+
+
+# pylint: disable=too-many-positional-arguments
 async def _refresh_subaru_data(
     hass: HomeAssistant,
     entry: ConfigEntry,
-    vehicle_info: dict,
+    vehicle_info: dict[str, VehicleInfo],
     controller: SubaruAPI,
+    rate_limiter: RateLimiter,
 ) -> dict:
     """
     Refresh local data with data fetched via Subaru API.
@@ -168,7 +359,7 @@ async def _refresh_subaru_data(
     data = {}
 
     for vehicle in vehicle_info.values():
-        vin = vehicle[VEHICLE_VIN]
+        vin = vehicle.vin
 
         # Poll vehicle, if option is enabled
         polling_option = PollingOptions.get_by_value(
@@ -184,40 +375,48 @@ async def _refresh_subaru_data(
                         await poll_subaru(
                             vehicle,
                             controller,
+                            rate_limiter,
                             update_interval=UPDATE_INTERVAL_CHARGING,
                         )
         elif polling_option == PollingOptions.ENABLE:
-            await poll_subaru(vehicle, controller)
+            await poll_subaru(vehicle, controller, rate_limiter)
 
         # Fetch data from Subaru servers
-        await refresh_subaru(vehicle, controller)
+        await refresh_subaru(vehicle, controller, rate_limiter)
 
         # Update our local data that will go to entity states
         received_data = await controller.get_data(vin)
         if received_data:
             data[vin] = received_data
-            _LOGGER.debug("Subaru data %s", pprint.pformat(received_data))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                import pprint  # pylint: disable=import-outside-toplevel
+
+                _LOGGER.debug("Subaru data %s", pprint.pformat(received_data))
 
     return data
 
 
-async def _get_vehicle_info(controller: SubaruAPI, vin: str) -> dict:
+async def _get_vehicle_info(
+    controller: SubaruAPI, rate_limiter: RateLimiter, vin: str
+) -> VehicleInfo:
     """Obtain vehicle identifiers and capabilities."""
-    info = {
-        VEHICLE_VIN: vin,
-        VEHICLE_MODEL_NAME: controller.get_model_name(vin),
-        VEHICLE_MODEL_YEAR: controller.get_model_year(vin),
-        VEHICLE_NAME: controller.vin_to_name(vin),
-        VEHICLE_HAS_EV: controller.get_ev_status(vin),
-        VEHICLE_API_GEN: controller.get_api_gen(vin),
-        VEHICLE_HAS_LOCK_STATUS: await controller.has_lock_status(vin),
-        VEHICLE_HAS_POWER_WINDOWS: await controller.has_power_windows(vin),
-        VEHICLE_HAS_SUNROOF: controller.has_sunroof(vin),
-        VEHICLE_HAS_REMOTE_START: controller.get_res_status(vin),
-        VEHICLE_HAS_REMOTE_SERVICE: controller.get_remote_status(vin),
-        VEHICLE_HAS_SAFETY_SERVICE: controller.get_safety_status(vin),
-        VEHICLE_HAS_TPMS: controller.has_tpms(vin),
-        VEHICLE_LAST_UPDATE: 0,
-        VEHICLE_LAST_FETCH: 0,
-    }
-    return info
+    # These capability checks may fetch vehicle data from the API
+    await rate_limiter.async_acquire()
+    has_lock_status = await controller.has_lock_status(vin)
+    await rate_limiter.async_acquire()
+    has_power_windows = await controller.has_power_windows(vin)
+    return VehicleInfo(
+        vin=vin,
+        model_name=controller.get_model_name(vin),
+        model_year=controller.get_model_year(vin),
+        name=controller.vin_to_name(vin),
+        api_gen=controller.get_api_gen(vin),
+        has_ev=controller.get_ev_status(vin),
+        has_lock_status=has_lock_status,
+        has_power_windows=has_power_windows,
+        has_sunroof=controller.has_sunroof(vin),
+        has_remote_start=controller.get_res_status(vin),
+        has_remote_service=controller.get_remote_status(vin),
+        has_safety_service=controller.get_safety_status(vin),
+        has_tpms=controller.has_tpms(vin),
+    )
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+from itertools import product
 
 import subarulink.const as sc
 
@@ -13,12 +12,9 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     API_GEN_2,
@@ -27,16 +23,11 @@ from .const import (
     DOMAIN,
     ENTRY_COORDINATOR,
     ENTRY_VEHICLES,
-    VEHICLE_API_GEN,
-    VEHICLE_HAS_EV,
-    VEHICLE_HAS_LOCK_STATUS,
-    VEHICLE_HAS_POWER_WINDOWS,
-    VEHICLE_HAS_SUNROOF,
-    VEHICLE_HEALTH,
-    VEHICLE_STATUS,
-    VEHICLE_VIN,
 )
+from .coordinator import LOCK_DOORS, SubaruDataUpdateCoordinator
 from .device import get_device_info
+from .entity import SubaruStateWriteLimit, async_add_reported_entities
+from .vehicle import VehicleInfo
 
 BINARY_SENSOR_ICONS = {
     BinarySensorDeviceClass.POWER: {True: "mdi:engine", False: "mdi:engine-off"},
@@ -70,6 +61,34 @@ ON_VALUES = {
     BinarySensorDeviceClass.LOCK: [sc.LOCK_LOCKED],
 }
 
+# MIL features reported in vehicle health data. Their on-dates are exposed as
+# attributes of the Trouble sensor but not recorded; they remain available in
+# device diagnostics.
+MIL_FEATURES = frozenset(
+    {
+        "ABS_MIL",
+        "AHBL_MIL",
+        "ATF_MIL",
+        "AWD_MIL",
+        "BSDRCT_MIL",
+        "CEL_MIL",
+        "EBD_MIL",
+        "EOL_MIL",
+        "EPAS_MIL",
+        "EPB_MIL",
+        "ESS_MIL",
+        "HEVCM_MIL",
+        "HEV_MIL",
+        "OPL_MIL",
+        "RAB_MIL",
+        "SRS_MIL",
+        "TEL_MIL",
+        "TPMS_MIL",
+        "VDC_MIL",
+        "WASH_MIL",
+    }
+)
+
 TROUBLE_BINARY_SENSOR = [
     BinarySensorEntityDescription(
         name="Trouble",
@@ -207,61 +226,117 @@ async def async_setup_entry(
     entities = []
     for info in vehicle_info.values():
         entities.extend(create_vehicle_binary_sensors(info, coordinator))
-    async_add_entities(entities)
+    async_add_reported_entities(
+        config_entry, coordinator, async_add_entities, entities, _is_reported
+    )
+
+
+def _is_reported(binary_sensor: SubaruBinarySensor, initial: bool) -> bool:
+    """Return True once the vehicle has reported a valid value for the sensor."""
+    # Without any data at setup (e.g. failed first fetch), add it as unavailable
+    if not (vehicle := binary_sensor.coordinator.vehicles.get(binary_sensor.vin)):
+        return initial
+    description = binary_sensor.entity_description
+    if description.device_class == BinarySensorDeviceClass.PROBLEM:
+        return description.key in vehicle.health
+    return description.key in vehicle.status
+
+
+def _binary_sensor_descriptions(
+    api_gen_2: bool,
+    has_power_windows: bool,
+    has_sunroof: bool,
+    has_ev: bool,
+    has_lock_status: bool,
+) -> tuple[BinarySensorEntityDescription, ...]:
+    """Return the binary sensor descriptions for one combination of capabilities."""
+    descriptions = [*TROUBLE_BINARY_SENSOR]
+    if api_gen_2:
+        descriptions.extend(API_GEN_2_BINARY_SENSORS)
+    if has_power_windows or has_sunroof:
+        descriptions.extend(POWER_WINDOW_BINARY_SENSORS)
+    if has_sunroof:
+        descriptions.extend(SUNROOF_BINARY_SENSORS)
+    if has_ev:
+        descriptions.extend(EV_BINARY_SENSORS)
+    if has_lock_status:
+        descriptions.extend(LOCK_BINARY_SENSORS)
+    return tuple(descriptions)
+
+
+# Binary sensor descriptions for every capability signature, built once at import
+BINARY_SENSOR_DESCRIPTIONS = {
+    signature: _binary_sensor_descriptions(*signature)
+    for signature in product((False, True), repeat=5)
+}
 
 
 def create_vehicle_binary_sensors(
-    vehicle_info: dict, coordinator: DataUpdateCoordinator
+    vehicle_info: VehicleInfo, coordinator: SubaruDataUpdateCoordinator
 ) -> list[SubaruBinarySensor]:
     """Instantiate all available binary sensors for the vehicle."""
-    binary_sensors_to_add = []
-    binary_sensors_to_add.extend(TROUBLE_BINARY_SENSOR)
-
-    if vehicle_info[VEHICLE_API_GEN] in [API_GEN_2, API_GEN_3, API_GEN_4]:
-        binary_sensors_to_add.extend(API_GEN_2_BINARY_SENSORS)
-
-    if vehicle_info[VEHICLE_HAS_POWER_WINDOWS] or vehicle_info[VEHICLE_HAS_SUNROOF]:
-        binary_sensors_to_add.extend(POWER_WINDOW_BINARY_SENSORS)
-
-    if vehicle_info[VEHICLE_HAS_SUNROOF]:
-        binary_sensors_to_add.extend(SUNROOF_BINARY_SENSORS)
-
-    if vehicle_info[VEHICLE_HAS_EV]:
-        binary_sensors_to_add.extend(EV_BINARY_SENSORS)
-
-    if vehicle_info[VEHICLE_HAS_LOCK_STATUS]:
-        binary_sensors_to_add.extend(LOCK_BINARY_SENSORS)
-
+    signature = (
+        vehicle_info.api_gen in [API_GEN_2, API_GEN_3, API_GEN_4],
+        bool(vehicle_info.has_power_windows),
+        bool(vehicle_info.has_sunroof),
+        bool(vehicle_info.has_ev),
+        bool(vehicle_info.has_lock_status),
+    )
     return [
         SubaruBinarySensor(vehicle_info, coordinator, description)
-        for description in binary_sensors_to_add
+        for description in BINARY_SENSOR_DESCRIPTIONS[signature]
     ]
 
 
 class SubaruBinarySensor(
-    CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], BinarySensorEntity
+    SubaruStateWriteLimit,
+    CoordinatorEntity[SubaruDataUpdateCoordinator],
+    BinarySensorEntity,
 ):
     """Class for Subaru binary sensors."""
 
     _attr_has_entity_name = True
+    _unrecorded_attributes = MIL_FEATURES
 
     def __init__(
         self,
-        vehicle_info: dict,
-        coordinator: DataUpdateCoordinator,
+        vehicle_info: VehicleInfo,
+        coordinator: SubaruDataUpdateCoordinator,
         description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self.vin = vehicle_info[VEHICLE_VIN]
+        super().__init__(coordinator, context=vehicle_info.vin)
+        self.vin = vehicle_info.vin
         self.entity_description = description
         self._attr_device_info = get_device_info(vehicle_info)
         self._attr_unique_id = f"{self.vin}_{description.key}"
 
-    @property
-    def icon(self) -> str:
-        """Return icon for sensor."""
-        return BINARY_SENSOR_ICONS[self.device_class][self.is_on]
+    _current_value: str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Compute initial state when added to hass."""
+        await super().async_added_to_hass()
+        self._update_values()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute state from new coordinator data, then write it."""
+        self._update_values()
+        super()._handle_coordinator_update()
+
+    def _update_values(self) -> None:
+        """Resolve raw value, on/off state and icon once per data update."""
+        self._current_value = self.get_current_value()
+        self._attr_is_on = self._current_value in ON_VALUES[self.device_class]
+        self._attr_icon = BINARY_SENSOR_ICONS[self.device_class][self._attr_is_on]
+
+        # If MIL is active, provide MIL names and timestamps
+        if self.device_class == BinarySensorDeviceClass.PROBLEM and (
+            vehicle := self.coordinator.vehicles.get(self.vin)
+        ):
+            self._attr_extra_state_attributes = (
+                vehicle.trouble_codes if vehicle.health.get(sc.HEALTH_TROUBLE) else None
+            )
 
     @property
     def available(self) -> bool:
@@ -269,38 +344,18 @@ class SubaruBinarySensor(
         last_update_success = super().available
         if last_update_success and self.vin not in self.coordinator.data:
             return False
-        if self.get_current_value() is None:
+        if self._current_value is None:
             return False
         return last_update_success
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the binary sensor is on."""
-        return self.get_current_value() in ON_VALUES[self.device_class]
-
     def get_current_value(self) -> str | None:
         """Get raw value from the coordinator."""
         value = None
-        if data := self.coordinator.data.get(self.vin):
+        if vehicle := self.coordinator.vehicles.get(self.vin):
             if self.device_class == BinarySensorDeviceClass.PROBLEM:
-                value = data[VEHICLE_HEALTH].get(self.entity_description.key)
+                value = vehicle.health.get(self.entity_description.key)
+            elif self.entity_description.key in LOCK_DOORS:
+                value = vehicle.locks.doors[self.entity_description.key]
             else:
-                value = data[VEHICLE_STATUS].get(self.entity_description.key)
+                value = vehicle.status.get(self.entity_description.key)
         return value
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return entity specific state attributes."""
-        extra_attributes = None
-
-        # If MIL is active, provide MIL names and timestamps
-        if self.device_class == BinarySensorDeviceClass.PROBLEM:
-            health_data = self.coordinator.data[self.vin][sc.VEHICLE_HEALTH]
-            if health_data[sc.HEALTH_TROUBLE]:
-                extra_attributes = {
-                    k: datetime.fromtimestamp(v[sc.HEALTH_ONDATE] / 1000)
-                    for k, v in health_data[sc.HEALTH_FEATURES].items()
-                    if v[sc.HEALTH_TROUBLE]
-                }
-
-        return extra_attributes
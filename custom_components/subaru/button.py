@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
+from itertools import product
 import logging
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
-    CONF_NOTIFICATION_OPTION,
+    CONF_QUEUE_BUTTON_COMMANDS,
     DOMAIN as SUBARU_DOMAIN,
-    ENTRY_CONTROLLER,
     ENTRY_COORDINATOR,
     ENTRY_VEHICLES,
     REMOTE_SERVICE_CHARGE_START,
@@ -25,14 +25,11 @@ from .const import (
     REMOTE_SERVICE_REFRESH,
     REMOTE_SERVICE_REMOTE_START,
     REMOTE_SERVICE_REMOTE_STOP,
-    VEHICLE_CLIMATE_SELECTED_PRESET,
-    VEHICLE_HAS_EV,
-    VEHICLE_HAS_REMOTE_SERVICE,
-    VEHICLE_HAS_REMOTE_START,
-    VEHICLE_VIN,
 )
+from .coordinator import SubaruDataUpdateCoordinator
 from .device import get_device_info
 from .remote_service import async_call_remote_service
+from .vehicle import VehicleInfo
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -90,23 +87,41 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-def create_vehicle_buttons(
-    vehicle_info: dict, coordinator: DataUpdateCoordinator, config_entry: ConfigEntry
-) -> list[SubaruButton]:
-    """Instantiate all available buttons for the vehicle."""
-    buttons_to_add = []
-    if vehicle_info[VEHICLE_HAS_REMOTE_SERVICE]:
-        buttons_to_add.extend(G1_REMOTE_BUTTONS)
+def _button_descriptions(
+    has_remote_service: bool, has_remote_start: bool, has_ev: bool
+) -> tuple[ButtonEntityDescription, ...]:
+    """Return the button descriptions for one combination of capabilities."""
+    descriptions: list[ButtonEntityDescription] = []
+    if has_remote_service:
+        descriptions.extend(G1_REMOTE_BUTTONS)
+        if has_remote_start or has_ev:
+            descriptions.extend(RES_REMOTE_BUTTONS)
+        if has_ev:
+            descriptions.extend(EV_REMOTE_BUTTONS)
+    return tuple(descriptions)
+
 
-        if vehicle_info[VEHICLE_HAS_REMOTE_START] or vehicle_info[VEHICLE_HAS_EV]:
-            buttons_to_add.extend(RES_REMOTE_BUTTONS)
+# Button descriptions for every capability signature, built once at import
+BUTTON_DESCRIPTIONS = {
+    signature: _button_descriptions(*signature)
+    for signature in product((False, True), repeat=3)
+}
 
-        if vehicle_info[VEHICLE_HAS_EV]:
-            buttons_to_add.extend(EV_REMOTE_BUTTONS)
 
+def create_vehicle_buttons(
+    vehicle_info: VehicleInfo,
+    coordinator: SubaruDataUpdateCoordinator,
+    config_entry: ConfigEntry,
+) -> list[SubaruButton]:
+    """Instantiate all available buttons for the vehicle."""
+    signature = (
+        bool(vehicle_info.has_remote_service),
+        bool(vehicle_info.has_remote_start),
+        bool(vehicle_info.has_ev),
+    )
     return [
         SubaruButton(vehicle_info, config_entry, coordinator, description)
-        for description in buttons_to_add
+        for description in BUTTON_DESCRIPTIONS[signature]
     ]
 
 
@@ -117,13 +132,13 @@ class SubaruButton(ButtonEntity):
 
     def __init__(
         self,
-        vehicle_info: dict,
+        vehicle_info: VehicleInfo,
         config_entry: ConfigEntry,
-        coordinator: DataUpdateCoordinator,
+        coordinator: SubaruDataUpdateCoordinator,
         description: ButtonEntityDescription,
     ) -> None:
         """Initialize the button for the vehicle."""
-        self.vin = vehicle_info[VEHICLE_VIN]
+        self.vin = vehicle_info.vin
         self.vehicle_info = vehicle_info
         self.entity_description = description
         self.config_entry = config_entry
@@ -135,20 +150,31 @@ class SubaruButton(ButtonEntity):
     async def async_press(self) -> None:
         """Press the button."""
         _LOGGER.info("%s button pressed", self.name)
+        if self.config_entry.options.get(CONF_QUEUE_BUTTON_COMMANDS):
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_press_queued(),
+                f"{SUBARU_DOMAIN} {self.entity_description.key} {self.vin}",
+            )
+            return
+        await self._async_press()
+
+    async def _async_press_queued(self) -> None:
+        """Run the command in the background; the outcome is reported by events."""
+        try:
+            await self._async_press()
+        except HomeAssistantError as err:
+            _LOGGER.debug("Queued %s failed: %s", self.entity_description.key, err)
+
+    async def _async_press(self) -> None:
         arg = None
         if self.entity_description.key == REMOTE_SERVICE_REMOTE_START:
-            arg = self.coordinator.data.get(self.vin).get(
-                VEHICLE_CLIMATE_SELECTED_PRESET
-            )
-        controller = self.hass.data[SUBARU_DOMAIN][self.config_entry.entry_id][
-            ENTRY_CONTROLLER
-        ]
+            arg = self.coordinator.get_selected_preset(self.vin)
         await async_call_remote_service(
             self.hass,
-            controller,
+            self.config_entry,
             self.entity_description.key,
             self.vehicle_info,
             arg,
-            self.config_entry.options.get(CONF_NOTIFICATION_OPTION),
         )
         await self.coordinator.async_refresh()
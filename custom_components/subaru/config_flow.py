@@ -27,7 +27,25 @@ from homeassistant.const import CONF_DEVICE_ID, CONF_PASSWORD, CONF_PIN, CONF_US
 from homeassistant.core import callback
 from homeassistant.helpers import aiohttp_client
 
-from .const import CONF_COUNTRY, CONF_NOTIFICATION_OPTION, CONF_POLLING_OPTION, DOMAIN
+from .const import (
+    CONF_COMMAND_DATA_MAX_AGE,
+    CONF_COMMAND_TIMEOUTS,
+    CONF_COUNTRY,
+    CONF_NOTIFICATION_OPTION,
+    CONF_POLLING_OPTION,
+    CONF_QUEUE_BUTTON_COMMANDS,
+    CONF_RATE_LIMIT_CAPACITY,
+    CONF_RATE_LIMIT_REFILL,
+    CONF_SKIP_REDUNDANT_COMMANDS,
+    CONF_STATE_WRITE_INTERVAL,
+    CONF_TRACKER_MOVEMENT_THRESHOLD,
+    DEFAULT_RATE_LIMIT_CAPACITY,
+    DEFAULT_RATE_LIMIT_REFILL,
+    DOMAIN,
+    FETCH_INTERVAL,
+    SENSOR_DEADBANDS,
+    STATE_WRITE_INTERVAL_PLATFORMS,
+)
 from .options import NotificationOptions, PollingOptions
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,6 +58,7 @@ class SubaruConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Subaru."""
 
     VERSION = 1
+    MINOR_VERSION = 3
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
     controller: SubaruAPI
@@ -284,22 +303,74 @@ class OptionsFlowHandler(OptionsFlow):
     ) -> ConfigFlowResult:
         """Handle options flow."""
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_POLLING_OPTION,
-                    default=self.config_entry.options.get(
-                        CONF_POLLING_OPTION, PollingOptions.DISABLE.value
-                    ),
-                ): vol.In(sorted(PollingOptions.list())),
-                vol.Required(
-                    CONF_NOTIFICATION_OPTION,
-                    default=self.config_entry.options.get(
-                        CONF_NOTIFICATION_OPTION, NotificationOptions.DISABLE.value
-                    ),
-                ): vol.In(sorted(NotificationOptions.list())),
-            }
-        )
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+            # Advanced options are not in the form for every user, so keep
+            # the saved values of fields that were not shown
+            options = {**self.config_entry.options, **user_input}
+            if self.show_advanced_options:
+                for key in CONF_COMMAND_TIMEOUTS:
+                    if key not in user_input:
+                        options.pop(key, None)
+            return self.async_create_entry(title="", data=options)
+
+        options = self.config_entry.options
+        schema = {
+            vol.Required(
+                CONF_POLLING_OPTION,
+                default=options.get(CONF_POLLING_OPTION, PollingOptions.DISABLE.value),
+            ): vol.In(sorted(PollingOptions.list())),
+            vol.Required(
+                CONF_NOTIFICATION_OPTION,
+                default=options.get(
+                    CONF_NOTIFICATION_OPTION, NotificationOptions.DISABLE.value
+                ),
+            ): vol.In(sorted(NotificationOptions.list())),
+        }
+        if self.show_advanced_options:
+            schema.update(
+                {
+                    vol.Required(
+                        CONF_RATE_LIMIT_CAPACITY,
+                        default=options.get(
+                            CONF_RATE_LIMIT_CAPACITY, DEFAULT_RATE_LIMIT_CAPACITY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Required(
+                        CONF_RATE_LIMIT_REFILL,
+                        default=options.get(
+                            CONF_RATE_LIMIT_REFILL, DEFAULT_RATE_LIMIT_REFILL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    **{
+                        vol.Optional(
+                            key, description={"suggested_value": options.get(key)}
+                        ): vol.All(vol.Coerce(int), vol.Range(min=0))
+                        for key in CONF_COMMAND_TIMEOUTS
+                    },
+                    vol.Required(
+                        CONF_SKIP_REDUNDANT_COMMANDS,
+                        default=options.get(CONF_SKIP_REDUNDANT_COMMANDS, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_COMMAND_DATA_MAX_AGE,
+                        default=options.get(CONF_COMMAND_DATA_MAX_AGE, FETCH_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_QUEUE_BUTTON_COMMANDS,
+                        default=options.get(CONF_QUEUE_BUTTON_COMMANDS, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_TRACKER_MOVEMENT_THRESHOLD,
+                        default=options.get(CONF_TRACKER_MOVEMENT_THRESHOLD, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                }
+            )
+            for platform in STATE_WRITE_INTERVAL_PLATFORMS:
+                key = CONF_STATE_WRITE_INTERVAL.format(platform)
+                schema[vol.Required(key, default=options.get(key, 0))] = vol.All(
+                    vol.Coerce(int), vol.Range(min=0)
+                )
+            for key, default in SENSOR_DEADBANDS.items():
+                schema[vol.Required(key, default=options.get(key, default))] = vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                )
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
@@ -11,21 +11,85 @@ UPDATE_INTERVAL_CHARGING = 1800
 CONF_POLLING_OPTION = "polling_option"
 CONF_NOTIFICATION_OPTION = "notification_option"
 CONF_COUNTRY = "country"
+CONF_RATE_LIMIT_CAPACITY = "rate_limit_capacity"
+CONF_RATE_LIMIT_REFILL = "rate_limit_refill_seconds"
+# Replaced by the per-group time limits below in config entry version 1.3
+CONF_COMMAND_TIMEOUT = "command_timeout"
+CONF_COMMAND_TIMEOUT_LOCK = "command_timeout_lock"
+CONF_COMMAND_TIMEOUT_REMOTE_START = "command_timeout_remote_start"
+CONF_COMMAND_TIMEOUT_OTHER = "command_timeout_other"
+CONF_SKIP_REDUNDANT_COMMANDS = "skip_redundant_commands"
+CONF_COMMAND_DATA_MAX_AGE = "command_data_max_age"
+CONF_QUEUE_BUTTON_COMMANDS = "queue_button_commands"
+CONF_TRACKER_MOVEMENT_THRESHOLD = "tracker_movement_threshold"
+CONF_STATE_WRITE_INTERVAL = "state_write_interval_{}"
+CONF_DEADBAND_TIRE_PRESSURE = "deadband_tire_pressure"
+CONF_DEADBAND_FUEL_LEVEL = "deadband_fuel_level"
+CONF_DEADBAND_FUEL_CONSUMPTION = "deadband_fuel_consumption"
+
+# Default sensor deadbands (in the sensor's native unit), by option
+SENSOR_DEADBANDS = {
+    CONF_DEADBAND_TIRE_PRESSURE: 0.5,
+    CONF_DEADBAND_FUEL_LEVEL: 2,
+    CONF_DEADBAND_FUEL_CONSUMPTION: 0.3,
+}
+
+# Seconds between the first refreshes of Subaru entries set up while Home
+# Assistant boots, plus up to STARTUP_JITTER random seconds for every entry but
+# the first
+STARTUP_STAGGER = 5
+STARTUP_JITTER = 5
+# hass.data key of each entry's RateLimiter, kept across reloads of the entry
+DATA_RATE_LIMITERS = f"{DOMAIN}_rate_limiters"
+
+# API rate limiter defaults (shared by all vehicles in an account)
+DEFAULT_RATE_LIMIT_CAPACITY = 10
+DEFAULT_RATE_LIMIT_REFILL = 6
 
 # entry fields
 ENTRY_CONTROLLER = "controller"
 ENTRY_COORDINATOR = "coordinator"
 ENTRY_VEHICLES = "vehicles"
 ENTRY_LISTENER = "listener"
+ENTRY_RATE_LIMITER = "rate_limiter"
+ENTRY_PLATFORMS = "platforms"
+ENTRY_COMMAND_LOCKS = "command_locks"
+ENTRY_COMMAND_STATUS = "command_status"
 
 # events
+EVENT_SUBARU_COMMAND_QUEUED = "subaru_command_queued"
 EVENT_SUBARU_COMMAND_SENT = "subaru_command_sent"
 EVENT_SUBARU_COMMAND_SUCCESS = "subaru_command_successful"
 EVENT_SUBARU_COMMAND_FAIL = "subaru_command_failed"
+EVENT_SUBARU_COMMANDS_FINISHED = "subaru_commands_finished"
+
+# dispatcher signal for command status updates, formatted with entry_id and VIN
+SIGNAL_COMMAND_STATUS = "subaru_command_status_{}_{}"
+
+# command status sensor states
+COMMAND_STATE_IDLE = "idle"
+COMMAND_STATE_QUEUED = "queued"
+COMMAND_STATE_RUNNING = "running"
+COMMAND_STATE_SUCCESS = "success"
+COMMAND_STATE_FAILED = "failed"
+COMMAND_STATE_SKIPPED = "skipped"
+COMMAND_STATES = [
+    COMMAND_STATE_IDLE,
+    COMMAND_STATE_QUEUED,
+    COMMAND_STATE_RUNNING,
+    COMMAND_STATE_SUCCESS,
+    COMMAND_STATE_FAILED,
+    COMMAND_STATE_SKIPPED,
+]
 
 # update coordinator name
 COORDINATOR_NAME = "subaru_data"
 
+# storage of per-vehicle user choices, keyed by config entry
+STORAGE_KEY = "subaru.{}"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
 # info fields
 VEHICLE_VIN = "vin"
 VEHICLE_MODEL_NAME = "model_name"
@@ -41,8 +105,6 @@ VEHICLE_HAS_REMOTE_START = "has_res"
 VEHICLE_HAS_REMOTE_SERVICE = "has_remote"
 VEHICLE_HAS_SAFETY_SERVICE = "has_safety"
 VEHICLE_HEALTH = "vehicle_health"
-VEHICLE_LAST_UPDATE = "last_update"
-VEHICLE_LAST_FETCH = "last_fetch"
 VEHICLE_STATUS = "vehicle_status"
 VEHICLE_CLIMATE = "climate"
 VEHICLE_CLIMATE_PRESET_NAME = "name"
@@ -54,7 +116,10 @@ API_GEN_3 = "g3"
 API_GEN_4 = "g4"
 MANUFACTURER = "Subaru"
 
+ATTR_COMMAND = "command"
+ATTR_COMMANDS = "commands"
 ATTR_DOOR = "door"
+ATTR_PRESET = "preset"
 
 REMOTE_SERVICE_REFRESH = "fetch"
 REMOTE_SERVICE_POLL_VEHICLE = "update"
@@ -69,6 +134,39 @@ REMOTE_SERVICE_REMOTE_STOP = "remote_stop"
 REMOTE_SERVICE_CHARGE_START = "charge_start"
 REMOTE_CLIMATE_PRESET_NAME = "preset_name"
 
+# Seconds to wait for a remote command before letting it finish in the background
+DEFAULT_COMMAND_TIMEOUT = 30
+COMMAND_TIMEOUTS = {
+    REMOTE_SERVICE_POLL_VEHICLE: 60,
+    REMOTE_SERVICE_REMOTE_START: 60,
+    REMOTE_SERVICE_REMOTE_STOP: 60,
+}
+# Option setting the time limit of each command, CONF_COMMAND_TIMEOUT_OTHER if absent
+COMMAND_TIMEOUT_OPTIONS = {
+    REMOTE_SERVICE_LOCK: CONF_COMMAND_TIMEOUT_LOCK,
+    REMOTE_SERVICE_UNLOCK: CONF_COMMAND_TIMEOUT_LOCK,
+    REMOTE_SERVICE_REMOTE_START: CONF_COMMAND_TIMEOUT_REMOTE_START,
+    REMOTE_SERVICE_REMOTE_STOP: CONF_COMMAND_TIMEOUT_REMOTE_START,
+}
+CONF_COMMAND_TIMEOUTS = (
+    CONF_COMMAND_TIMEOUT_LOCK,
+    CONF_COMMAND_TIMEOUT_REMOTE_START,
+    CONF_COMMAND_TIMEOUT_OTHER,
+)
+
+SERVICE_RUN_COMMANDS = "run_commands"
+RUN_COMMANDS_VALID_COMMANDS = [
+    REMOTE_SERVICE_POLL_VEHICLE,
+    REMOTE_SERVICE_LOCK,
+    REMOTE_SERVICE_UNLOCK,
+    REMOTE_SERVICE_LIGHTS,
+    REMOTE_SERVICE_LIGHTS_STOP,
+    REMOTE_SERVICE_HORN,
+    REMOTE_SERVICE_HORN_STOP,
+    REMOTE_SERVICE_REMOTE_START,
+    REMOTE_SERVICE_REMOTE_STOP,
+    REMOTE_SERVICE_CHARGE_START,
+]
 SERVICE_UNLOCK_SPECIFIC_DOOR = "unlock_specific_door"
 UNLOCK_DOOR_ALL = "all"
 UNLOCK_DOOR_DRIVERS = "driver"
@@ -78,6 +176,8 @@ UNLOCK_VALID_DOORS = {
     UNLOCK_DOOR_DRIVERS: sc.DRIVERS_DOOR,
     UNLOCK_DOOR_TAILGATE: sc.TAILGATE_DOOR,
 }
+# maximum number of vehicles sent unlock_specific_door commands at once
+UNLOCK_SPECIFIC_DOOR_CONCURRENCY = 4
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -87,3 +187,11 @@ PLATFORMS = [
     Platform.BUTTON,
     Platform.SELECT,
 ]
+# Platforms whose entities can limit how often their state is written
+STATE_WRITE_INTERVAL_PLATFORMS = [
+    Platform.BINARY_SENSOR,
+    Platform.DEVICE_TRACKER,
+    Platform.LOCK,
+    Platform.SELECT,
+    Platform.SENSOR,
+]
@@ -0,0 +1,290 @@
+"""Data update coordinator for the Subaru integration."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timedelta
+import logging
+from types import MappingProxyType
+from typing import Any
+
+import subarulink.const as sc
+
+from homeassistant.const import UnitOfLength, UnitOfPressure, UnitOfVolume
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util.unit_conversion import (
+    DistanceConverter,
+    PressureConverter,
+    VolumeConverter,
+)
+from homeassistant.util.unit_system import METRIC_SYSTEM, UnitSystem
+
+from .const import (
+    COORDINATOR_NAME,
+    FETCH_INTERVAL,
+    VEHICLE_CLIMATE,
+    VEHICLE_CLIMATE_PRESET_NAME,
+    VEHICLE_HEALTH,
+    VEHICLE_STATUS,
+)
+from .store import SelectedPresetStore
+
+_LOGGER = logging.getLogger(__name__)
+
+L_PER_GAL = VolumeConverter.convert(1, UnitOfVolume.GALLONS, UnitOfVolume.LITERS)
+KM_PER_MI = DistanceConverter.convert(1, UnitOfLength.MILES, UnitOfLength.KILOMETERS)
+
+# Read-only copy of the data subarulink reported for one vehicle
+VehicleSnapshot = Mapping[str, Any]
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Return a read-only copy of reported vehicle data.
+
+    Mappings at every level become MappingProxyType. Lists stay lists (of
+    frozen items) so snapshots still compare equal to, and serialize like, the
+    data subarulink reported.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_freeze(item) for item in value]
+    return value
+
+
+LOCK_DOORS = (
+    sc.LOCK_BOOT_STATUS,
+    sc.LOCK_FRONT_LEFT_STATUS,
+    sc.LOCK_FRONT_RIGHT_STATUS,
+    sc.LOCK_REAR_LEFT_STATUS,
+    sc.LOCK_REAR_RIGHT_STATUS,
+)
+
+
+class DoorLockState:
+    """Lock status of each door, as shared by the lock and door lock sensors."""
+
+    __slots__ = ("all_locked", "doors", "unlocked_count")
+
+    def __init__(self, status: dict[str, Any]) -> None:
+        """Summarize the lock status values of a vehicle status dict."""
+        self.doors: dict[str, str | None] = {
+            door: status.get(door) for door in LOCK_DOORS
+        }
+        self.all_locked = all(value == sc.LOCK_LOCKED for value in self.doors.values())
+        self.unlocked_count = sum(
+            value == sc.LOCK_UNLOCKED for value in self.doors.values()
+        )
+
+
+class ClimatePresets:
+    """Climate presets of a vehicle, indexed by name."""
+
+    __slots__ = ("_source", "by_name", "names")
+
+    def __init__(self, presets: Any) -> None:
+        """Index a preset list as reported by subarulink."""
+        self._source: list[dict[str, Any]] = (
+            presets if isinstance(presets, list) else []
+        )
+        self.by_name: dict[str, dict[str, Any]] = {
+            preset[VEHICLE_CLIMATE_PRESET_NAME]: preset for preset in self._source
+        }
+        self.names = list(self.by_name)
+
+    def unchanged(self, presets: Any) -> bool:
+        """Return True if the preset list is the one this index was built from."""
+        if not isinstance(presets, list):
+            return not self._source
+        return presets == self._source
+
+
+class VehicleData:
+    """
+    Normalized view of one vehicle's latest data snapshot.
+
+    Invalid readings are dropped and values that the integration converts
+    itself (average fuel consumption, recommended tire pressure) are already in
+    the Home Assistant unit system, so entities only need to look values up.
+    """
+
+    __slots__ = (
+        "_health_features",
+        "data",
+        "_recommended_tire_pressure",
+        "health",
+        "locks",
+        "metric",
+        "presets",
+        "status",
+        "tire_pressure_attributes",
+        "trouble_codes",
+    )
+
+    def __init__(
+        self,
+        data: VehicleSnapshot,
+        units: UnitSystem,
+        previous: VehicleData | None = None,
+    ) -> None:
+        """Build the view, reusing parts of the previous view that are unchanged."""
+        self.data = data
+        self.metric = units == METRIC_SYSTEM
+        self.status: dict[str, Any] = {
+            key: value
+            for key, value in data.get(VEHICLE_STATUS, {}).items()
+            if value not in sc.BAD_SENSOR_VALUES
+        }
+        self.health: Mapping[str, Any] = data.get(VEHICLE_HEALTH, {})
+
+        if self.metric and (value := self.status.get(sc.AVG_FUEL_CONSUMPTION)):
+            self.status[sc.AVG_FUEL_CONSUMPTION] = round(
+                (100.0 * L_PER_GAL) / (KM_PER_MI * value), 1
+            )
+
+        self.locks = DoorLockState(self.status)
+        if previous is not None and previous.locks.doors == self.locks.doors:
+            self.locks = previous.locks
+
+        presets = data.get(VEHICLE_CLIMATE)
+        if previous is not None and previous.presets.unchanged(presets):
+            self.presets = previous.presets
+        else:
+            self.presets = ClimatePresets(presets)
+
+        # Trouble codes (MIL) only change when a health fetch reports different
+        # features, so the active codes are kept from the previous view otherwise
+        features = self.health.get(sc.HEALTH_FEATURES, {})
+        if previous is not None and previous._health_features == features:
+            self._health_features = previous._health_features
+            self.trouble_codes = previous.trouble_codes
+        else:
+            self._health_features = features
+            self.trouble_codes = {
+                name: datetime.fromtimestamp(feature[sc.HEALTH_ONDATE] / 1000)
+                for name, feature in features.items()
+                if feature[sc.HEALTH_TROUBLE]
+            }
+
+        # Recommended tire pressure rarely changes, so its attributes are only
+        # rebuilt when the health data reports different values
+        recommended = self.health.get(sc.HEALTH_RECOMMENDED_TIRE_PRESSURE, {})
+        if (
+            previous is not None
+            and previous.metric == self.metric
+            and previous._recommended_tire_pressure == recommended
+        ):
+            self._recommended_tire_pressure = previous._recommended_tire_pressure
+            self.tire_pressure_attributes = previous.tire_pressure_attributes
+        else:
+            self._recommended_tire_pressure = dict(recommended)
+            self.tire_pressure_attributes = {
+                key: {
+                    "Recommended pressure": self._convert_pressure(recommended.get(key))
+                }
+                for key in (
+                    sc.HEALTH_RECOMMENDED_TIRE_PRESSURE_FRONT,
+                    sc.HEALTH_RECOMMENDED_TIRE_PRESSURE_REAR,
+                )
+            }
+
+    def _convert_pressure(self, value: float | None) -> float | None:
+        if value and self.metric:
+            return round(
+                PressureConverter.convert(
+                    value, UnitOfPressure.PSI, UnitOfPressure.KPA
+                ),
+                0,
+            )
+        return value
+
+
+class SubaruDataUpdateCoordinator(DataUpdateCoordinator[dict[str, VehicleSnapshot]]):
+    """
+    Coordinator that also keeps a normalized view of each vehicle's data.
+
+    Each vehicle's data is a read-only snapshot, copied from subarulink (which
+    updates its own data in place) only when it changed. Unchanged snapshots
+    and their views are carried over to the next update, so they can be
+    shared and compared by identity. User choices such as the selected climate
+    preset are kept in a separate store instead of the snapshots.
+
+    Vehicle entities listen with their VIN as context, so data fetched for one
+    vehicle after a command only updates that vehicle's entities.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        update_method: Callable[[], Awaitable[dict[str, Any]]],
+        presets: SelectedPresetStore,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=COORDINATOR_NAME,
+            update_method=update_method,
+            update_interval=timedelta(seconds=FETCH_INTERVAL),
+        )
+        self.presets = presets
+        self.vehicles: dict[str, VehicleData] = {}
+
+    async def _async_update_data(self) -> dict[str, VehicleSnapshot]:
+        """Fetch data and take snapshots of what changed."""
+        data = await super()._async_update_data()
+        return {
+            vin: self._snapshot(vin, vehicle_data) for vin, vehicle_data in data.items()
+        }
+
+    def _snapshot(self, vin: str, data: VehicleSnapshot) -> VehicleSnapshot:
+        previous = (self.data or {}).get(vin)
+        if previous is not None and previous == data:
+            return previous
+        return _freeze(data)
+
+    def _view(self, vin: str, data: VehicleSnapshot) -> VehicleData:
+        units = self.hass.config.units
+        previous = self.vehicles.get(vin)
+        if (
+            previous is not None
+            and previous.data == data
+            and previous.metric == (units == METRIC_SYSTEM)
+        ):
+            return previous
+        return VehicleData(data, units, previous)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Rebuild the vehicle views from new data, then notify listeners."""
+        self.vehicles = {
+            vin: self._view(vin, data) for vin, data in (self.data or {}).items()
+        }
+        super().async_update_listeners()
+
+    @callback
+    def async_update_vehicle(self, vin: str, data: VehicleSnapshot | None) -> None:
+        """Take one vehicle's data fetched by a command and notify its listeners."""
+        if not data:
+            return
+        snapshot = self._snapshot(vin, data)
+        self.data = {**(self.data or {}), vin: snapshot}
+        self.vehicles[vin] = self._view(vin, snapshot)
+        for update_callback, context in list(self._listeners.values()):
+            if context in (vin, None):
+                update_callback()
+
+    def get_selected_preset(self, vin: str) -> str | None:
+        """Return the climate preset selected for remote start."""
+        return self.presets.get(vin)
+
+    @callback
+    def select_preset(self, vin: str, name: str) -> bool:
+        """Select a climate preset for remote start, if the vehicle has it."""
+        vehicle = self.vehicles.get(vin)
+        if vehicle is None or name not in vehicle.presets.by_name:
+            return False
+        self.presets.async_set(vin, name)
+        return True
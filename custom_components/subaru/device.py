@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from homeassistant.helpers.entity import DeviceInfo
 
-from .const import (
-    DOMAIN,
-    MANUFACTURER,
-    VEHICLE_MODEL_NAME,
-    VEHICLE_MODEL_YEAR,
-    VEHICLE_NAME,
-    VEHICLE_VIN,
-)
-
-
-def get_device_info(vehicle_info: dict) -> DeviceInfo:
-    """Return DeviceInfo object based on vehicle info."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, vehicle_info[VEHICLE_VIN])},
-        manufacturer=MANUFACTURER,
-        model=f"{vehicle_info[VEHICLE_MODEL_YEAR]} {vehicle_info[VEHICLE_MODEL_NAME]}",
-        name=vehicle_info[VEHICLE_NAME],
-    )
+from .const import DOMAIN, MANUFACTURER
+from .vehicle import VehicleInfo
+
+# One DeviceInfo per vehicle, shared by all of the vehicle's entities until
+# its config entry unloads
+_DEVICE_INFO: dict[VehicleInfo, DeviceInfo] = {}
+
+
+def get_device_info(vehicle_info: VehicleInfo) -> DeviceInfo:
+    """Return the shared DeviceInfo object for a vehicle."""
+    if (device_info := _DEVICE_INFO.get(vehicle_info)) is None:
+        device_info = _DEVICE_INFO[vehicle_info] = DeviceInfo(
+            identifiers={(DOMAIN, vehicle_info.vin)},
+            manufacturer=MANUFACTURER,
+            model=f"{vehicle_info.model_year} {vehicle_info.model_name}",
+            name=vehicle_info.name,
+        )
+    return device_info
+
+
+def forget_device_info(vehicles: Iterable[VehicleInfo]) -> None:
+    """Drop the shared DeviceInfo objects of an unloaded entry's vehicles."""
+    for vehicle_info in vehicles:
+        _DEVICE_INFO.pop(vehicle_info, None)
@@ -9,22 +9,23 @@ from subarulink.const import LATITUDE, LONGITUDE, TIMESTAMP
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util.location import distance
 
 from .const import (
+    CONF_TRACKER_MOVEMENT_THRESHOLD,
     DOMAIN,
     ENTRY_COORDINATOR,
     ENTRY_VEHICLES,
-    VEHICLE_HAS_REMOTE_SERVICE,
-    VEHICLE_STATUS,
-    VEHICLE_VIN,
 )
+from .coordinator import SubaruDataUpdateCoordinator
 from .device import get_device_info
+from .entity import SubaruStateWriteLimit
+from .vehicle import VehicleInfo
+
+ATTR_POSITION_TIMESTAMP = "Position timestamp"
 
 
 async def async_setup_entry(
@@ -34,49 +35,109 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Subaru device tracker by config_entry."""
     entry: dict = hass.data[DOMAIN][config_entry.entry_id]
-    coordinator: DataUpdateCoordinator = entry[ENTRY_COORDINATOR]
-    vehicle_info: dict = entry[ENTRY_VEHICLES]
+    coordinator: SubaruDataUpdateCoordinator = entry[ENTRY_COORDINATOR]
+    vehicle_info: dict[str, VehicleInfo] = entry[ENTRY_VEHICLES]
     entities: list[SubaruDeviceTracker] = []
     for vehicle in vehicle_info.values():
-        if vehicle[VEHICLE_HAS_REMOTE_SERVICE]:
-            entities.append(SubaruDeviceTracker(vehicle, coordinator))
+        if vehicle.has_remote_service:
+            entities.append(SubaruDeviceTracker(vehicle, coordinator, config_entry))
     async_add_entities(entities)
 
 
 class SubaruDeviceTracker(
-    CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], TrackerEntity
+    SubaruStateWriteLimit, CoordinatorEntity[SubaruDataUpdateCoordinator], TrackerEntity
 ):
     """Class for Subaru device tracker."""
 
     _attr_icon = "mdi:car"
     _attr_has_entity_name = True
     _attr_name = None
-
-    def __init__(self, vehicle_info: dict, coordinator: DataUpdateCoordinator) -> None:
+    _unrecorded_attributes = frozenset({ATTR_POSITION_TIMESTAMP})
+
+    _latitude: float | None = None
+    _longitude: float | None = None
+    _timestamp: Any = None
+    _has_position = False
+    _last_update_success = True
+
+    def __init__(
+        self,
+        vehicle_info: VehicleInfo,
+        coordinator: SubaruDataUpdateCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
         """Initialize the device tracker."""
-        super().__init__(coordinator)
-        self.vin = vehicle_info[VEHICLE_VIN]
+        super().__init__(coordinator, context=vehicle_info.vin)
+        self.vin = vehicle_info.vin
+        self.config_entry = config_entry
         self._attr_device_info = get_device_info(vehicle_info)
         self._attr_unique_id = f"{self.vin}_location"
 
+    async def async_added_to_hass(self) -> None:
+        """Take the initial position when added to hass."""
+        await super().async_added_to_hass()
+        self._last_update_success = self.coordinator.last_update_success
+        self._update_position()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take the new position and write it, unless the vehicle hasn't moved."""
+        last_update_success = self.coordinator.last_update_success
+        if self._update_position() or last_update_success != self._last_update_success:
+            self._last_update_success = last_update_success
+            super()._handle_coordinator_update()
+
+    def _update_position(self) -> bool:
+        """Take position from the latest data and return True if it changed.
+
+        A new position closer than the configured movement threshold to the
+        current one is treated as GPS jitter of a parked vehicle and ignored,
+        together with its timestamp.
+        """
+        status = {}
+        if vehicle := self.coordinator.vehicles.get(self.vin):
+            status = vehicle.status
+        has_position = bool(status.keys() & {LATITUDE, LONGITUDE, TIMESTAMP})
+        latitude = status.get(LATITUDE)
+        longitude = status.get(LONGITUDE)
+
+        threshold = self.config_entry.options.get(CONF_TRACKER_MOVEMENT_THRESHOLD, 0)
+        if (
+            threshold
+            and has_position
+            and self._has_position
+            and latitude is not None
+            and longitude is not None
+        ):
+            moved = distance(self._latitude, self._longitude, latitude, longitude)
+            if moved is not None and moved < threshold:
+                return False
+
+        position = (has_position, latitude, longitude, status.get(TIMESTAMP))
+        if position == (
+            self._has_position,
+            self._latitude,
+            self._longitude,
+            self._timestamp,
+        ):
+            return False
+        self._has_position, self._latitude, self._longitude, self._timestamp = position
+        return True
+
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return entity specific state attributes."""
-        return {
-            "Position timestamp": self.coordinator.data[self.vin][VEHICLE_STATUS].get(
-                TIMESTAMP
-            )
-        }
+        return {ATTR_POSITION_TIMESTAMP: self._timestamp}
 
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the vehicle."""
-        return self.coordinator.data[self.vin][VEHICLE_STATUS].get(LATITUDE)
+        return self._latitude
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the vehicle."""
-        return self.coordinator.data[self.vin][VEHICLE_STATUS].get(LONGITUDE)
+        return self._longitude
 
     @property
     def source_type(self) -> SourceType:
@@ -86,7 +147,4 @@ class SubaruDeviceTracker(
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if vehicle_data := self.coordinator.data.get(self.vin):
-            if status := vehicle_data.get(VEHICLE_STATUS):
-                return status.keys() & {LATITUDE, LONGITUDE, TIMESTAMP}
-        return False
+        return super().available and self._has_position
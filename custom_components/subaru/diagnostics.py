@@ -19,7 +19,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from .const import DOMAIN, ENTRY_CONTROLLER, ENTRY_COORDINATOR, VEHICLE_VIN
+from .const import (
+    DOMAIN,
+    ENTRY_CONTROLLER,
+    ENTRY_COORDINATOR,
+    ENTRY_RATE_LIMITER,
+    VEHICLE_VIN,
+)
 
 CONFIG_FIELDS_TO_REDACT = [CONF_USERNAME, CONF_PASSWORD, CONF_PIN, CONF_DEVICE_ID]
 DATA_FIELDS_TO_REDACT = [VEHICLE_VIN, VEHICLE_NAME, LATITUDE, LONGITUDE, ODOMETER]
@@ -29,7 +35,8 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id][ENTRY_COORDINATOR]
+    entry = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry[ENTRY_COORDINATOR]
 
     diagnostics_data = {
         "config_entry": async_redact_data(config_entry.data, CONFIG_FIELDS_TO_REDACT),
@@ -38,6 +45,7 @@ async def async_get_config_entry_diagnostics(
             async_redact_data(info, DATA_FIELDS_TO_REDACT)
             for info in coordinator.data.values()
         ],
+        "rate_limiter": entry[ENTRY_RATE_LIMITER].as_dict(),
     }
 
     return diagnostics_data
@@ -0,0 +1,99 @@
+"""Behavior shared by Subaru entities."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from datetime import datetime
+import time
+from typing import TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CONF_STATE_WRITE_INTERVAL
+from .coordinator import SubaruDataUpdateCoordinator
+
+_EntityT = TypeVar("_EntityT", bound=Entity)
+
+
+@callback
+def async_add_reported_entities(
+    config_entry: ConfigEntry,
+    coordinator: SubaruDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    entities: Sequence[_EntityT],
+    is_reported: Callable[[_EntityT, bool], bool],
+) -> None:
+    """
+    Add the entities whose data the vehicle reports.
+
+    Entities for which `is_reported` is False are held back and added after
+    a later coordinator update reports their data, so vehicles do not get
+    entities that would never become available. Its second argument is True
+    only during setup.
+    """
+    pending = list(entities)
+
+    @callback
+    def _async_add_reported(initial: bool = False) -> None:
+        if reported := [entity for entity in pending if is_reported(entity, initial)]:
+            pending[:] = [entity for entity in pending if entity not in reported]
+            async_add_entities(reported)
+
+    _async_add_reported(initial=True)
+    if pending:
+        config_entry.async_on_unload(
+            coordinator.async_add_listener(_async_add_reported)
+        )
+
+
+class SubaruStateWriteLimit(Entity):
+    """
+    Entity mixin that limits how often state is written.
+
+    The minimum interval is the platform's state_write_interval option. A
+    write requested sooner than that after the previous one is held back and
+    made when the interval expires, so a burst of updates results in at most
+    two writes and the last one always reflects the latest state.
+    """
+
+    _last_state_write: float | None = None
+    _unsub_state_write: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state now, or once the minimum interval has passed."""
+        if self._unsub_state_write is not None:
+            return
+        now = time.monotonic()
+        if (
+            self._last_state_write is not None
+            and (platform := self.platform) is not None
+            and platform.config_entry is not None
+        ):
+            interval = platform.config_entry.options.get(
+                CONF_STATE_WRITE_INTERVAL.format(platform.domain), 0
+            )
+            if (delay := self._last_state_write + interval - now) > 0:
+                self._unsub_state_write = async_call_later(
+                    self.hass, delay, self._async_delayed_state_write
+                )
+                return
+        self._last_state_write = now
+        super().async_write_ha_state()
+
+    @callback
+    def _async_delayed_state_write(self, _: datetime) -> None:
+        self._unsub_state_write = None
+        self._last_state_write = time.monotonic()
+        super().async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a pending state write."""
+        await super().async_will_remove_from_hass()
+        if self._unsub_state_write is not None:
+            self._unsub_state_write()
+            self._unsub_state_write = None
@@ -2,50 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
-from subarulink.const import (
-    LOCK_BOOT_STATUS,
-    LOCK_FRONT_LEFT_STATUS,
-    LOCK_FRONT_RIGHT_STATUS,
-    LOCK_LOCKED,
-    LOCK_REAR_LEFT_STATUS,
-    LOCK_REAR_RIGHT_STATUS,
-)
-from subarulink.controller import Controller
+from subarulink.exceptions import SubaruException
 import voluptuous as vol
 
-from homeassistant.components.lock import LockEntity
+from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN, LockEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import SERVICE_LOCK, SERVICE_UNLOCK
-from homeassistant.core import HomeAssistant
+from homeassistant.const import SERVICE_LOCK, SERVICE_UNLOCK, Platform
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity_platform
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.service import async_extract_entity_ids
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN
 from .const import (
     ATTR_DOOR,
-    CONF_NOTIFICATION_OPTION,
     ENTRY_CONTROLLER,
     ENTRY_COORDINATOR,
+    ENTRY_PLATFORMS,
+    ENTRY_RATE_LIMITER,
     ENTRY_VEHICLES,
     SERVICE_UNLOCK_SPECIFIC_DOOR,
     UNLOCK_DOOR_ALL,
+    UNLOCK_SPECIFIC_DOOR_CONCURRENCY,
     UNLOCK_VALID_DOORS,
-    VEHICLE_HAS_LOCK_STATUS,
-    VEHICLE_HAS_REMOTE_SERVICE,
-    VEHICLE_NAME,
-    VEHICLE_STATUS,
-    VEHICLE_VIN,
 )
+from .coordinator import LOCK_DOORS, SubaruDataUpdateCoordinator
 from .device import get_device_info
-from .remote_service import async_call_remote_service
+from .entity import SubaruStateWriteLimit
+from .remote_service import (
+    async_call_remote_service,
+    async_update_vehicle_data,
+    refresh_subaru,
+)
+from .vehicle import VehicleInfo
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,24 +59,112 @@ async def async_setup_entry(
     """Set up the Subaru locks by config_entry."""
     entry = hass.data[DOMAIN][config_entry.entry_id]
     coordinator = entry[ENTRY_COORDINATOR]
-    controller = entry[ENTRY_CONTROLLER]
     vehicle_info = entry[ENTRY_VEHICLES]
     async_add_entities(
-        SubaruLock(vehicle, coordinator, controller, config_entry)
+        SubaruLock(vehicle, coordinator, config_entry)
         for vehicle in vehicle_info.values()
-        if vehicle[VEHICLE_HAS_REMOTE_SERVICE]
+        if vehicle.has_remote_service
     )
 
-    platform = entity_platform.async_get_current_platform()
+    config_entry.async_on_unload(
+        lambda: _async_remove_unlock_specific_door(hass, config_entry)
+    )
+    if hass.services.has_service(DOMAIN, SERVICE_UNLOCK_SPECIFIC_DOOR):
+        return
+
+    async def async_unlock_specific_door(call: ServiceCall) -> ServiceResponse:
+        return await _async_unlock_specific_door(hass, call)
 
-    platform.async_register_entity_service(
+    hass.services.async_register(
+        DOMAIN,
         SERVICE_UNLOCK_SPECIFIC_DOOR,
-        {vol.Required(ATTR_DOOR): vol.In(UNLOCK_VALID_DOORS)},
-        "async_unlock_specific_door",
+        async_unlock_specific_door,
+        schema=cv.make_entity_service_schema(
+            {vol.Required(ATTR_DOOR): vol.In(UNLOCK_VALID_DOORS)}
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
 
-class SubaruLock(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], LockEntity):
+@callback
+def _async_remove_unlock_specific_door(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Remove the unlock_specific_door service once no entry has locks."""
+    if not any(
+        entry_id != config_entry.entry_id and Platform.LOCK in entry[ENTRY_PLATFORMS]
+        for entry_id, entry in hass.data[DOMAIN].items()
+    ):
+        hass.services.async_remove(DOMAIN, SERVICE_UNLOCK_SPECIFIC_DOOR)
+
+
+async def _async_unlock_specific_door(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """
+    Unlock a door on every targeted vehicle.
+
+    Unlock commands run concurrently, up to a limit, without the usual
+    per-command fetch. Vehicles whose unlock completed are then refreshed
+    together once all commands have finished. Returns each lock's result when
+    requested, otherwise raises if any vehicle failed.
+    """
+    door = call.data[ATTR_DOOR]
+    entity_ids = await async_extract_entity_ids(call)
+    locks: list[SubaruLock] = [
+        entity
+        for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+        if platform.domain == LOCK_DOMAIN
+        for entity_id, entity in platform.entities.items()
+        if entity_id in entity_ids
+    ]
+    semaphore = asyncio.Semaphore(UNLOCK_SPECIFIC_DOOR_CONCURRENCY)
+
+    async def unlock(lock: SubaruLock) -> tuple[bool, str | None]:
+        async with semaphore:
+            try:
+                completed = await lock.async_unlock_specific_door(door, refresh=False)
+            except HomeAssistantError as err:
+                return False, str(err.__cause__ or err)
+        return completed, None
+
+    results = await asyncio.gather(*(unlock(lock) for lock in locks))
+    errors = [error for _, error in results]
+
+    # Skipped, failed or still running commands have nothing new to fetch
+    for lock, (completed, _) in zip(locks, results):
+        if not completed:
+            continue
+        entry = hass.data[DOMAIN][lock.config_entry.entry_id]
+        try:
+            await refresh_subaru(
+                lock.vehicle_info,
+                entry[ENTRY_CONTROLLER],
+                entry[ENTRY_RATE_LIMITER],
+                refresh_interval=0,
+            )
+        except SubaruException as err:
+            _LOGGER.warning("Unable to refresh %s: %s", lock.car_name, err.message)
+        await async_update_vehicle_data(hass, lock.config_entry, lock.vehicle_info)
+        lock.async_write_ha_state()
+
+    if call.return_response:
+        return {
+            lock.entity_id: {
+                "vehicle": lock.car_name,
+                "success": error is None,
+                "message": error,
+            }
+            for lock, error in zip(locks, errors)
+        }
+    if any(error is not None for error in errors):
+        raise HomeAssistantError("Failed to unlock doors")
+    return None
+
+
+class SubaruLock(
+    SubaruStateWriteLimit, CoordinatorEntity[SubaruDataUpdateCoordinator], LockEntity
+):
     """
     Representation of a Subaru door lock.
 
@@ -86,22 +175,21 @@ class SubaruLock(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], LockE
 
     _attr_has_entity_name = True
     _attr_translation_key = "door_locks"
+    _unrecorded_attributes = frozenset(LOCK_DOORS)
 
     def __init__(
         self,
-        vehicle_info: dict,
-        coordinator: DataUpdateCoordinator,
-        controller: Controller,
+        vehicle_info: VehicleInfo,
+        coordinator: SubaruDataUpdateCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the locks for the vehicle."""
-        super().__init__(coordinator)
-        self.controller = controller
+        super().__init__(coordinator, context=vehicle_info.vin)
         self.config_entry = config_entry
         self.vehicle_info = vehicle_info
-        self.vin = vehicle_info[VEHICLE_VIN]
-        self.car_name = vehicle_info[VEHICLE_NAME]
-        self.lock_status_available = self.vehicle_info[VEHICLE_HAS_LOCK_STATUS]
+        self.vin = vehicle_info.vin
+        self.car_name = vehicle_info.name
+        self.lock_status_available = self.vehicle_info.has_lock_status
         self._attr_unique_id = f"{self.vin}_door_locks"
         self._attr_device_info = get_device_info(vehicle_info)
 
@@ -114,18 +202,17 @@ class SubaruLock(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], LockE
         try:
             await async_call_remote_service(
                 self.hass,
-                self.controller,
+                self.config_entry,
                 SERVICE_LOCK,
                 self.vehicle_info,
                 None,
-                self.config_entry.options.get(CONF_NOTIFICATION_OPTION),
             )
         except HomeAssistantError as err:
             raise HomeAssistantError("Failed to lock doors") from err
         finally:
             if self.lock_status_available:
                 self._attr_is_locking = False
-            self.coordinator.async_update_listeners()
+            self.async_write_ha_state()
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Send the unlock command."""
@@ -136,83 +223,58 @@ class SubaruLock(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], LockE
         try:
             await async_call_remote_service(
                 self.hass,
-                self.controller,
+                self.config_entry,
                 SERVICE_UNLOCK,
                 self.vehicle_info,
                 UNLOCK_VALID_DOORS[UNLOCK_DOOR_ALL],
-                self.config_entry.options.get(CONF_NOTIFICATION_OPTION),
             )
         except HomeAssistantError as err:
             raise HomeAssistantError("Failed to unlock doors") from err
         finally:
             if self.lock_status_available:
                 self._attr_is_unlocking = False
-            self.coordinator.async_update_listeners()
+            self.async_write_ha_state()
 
     @property
     def is_locked(self) -> bool | None:
         """Return true if all doors are locked."""
         if self.lock_status_available:
-            if self.vin not in self.coordinator.data:
+            if not (vehicle := self.coordinator.vehicles.get(self.vin)):
                 return None
-            for door in [
-                LOCK_BOOT_STATUS,
-                LOCK_FRONT_LEFT_STATUS,
-                LOCK_FRONT_RIGHT_STATUS,
-                LOCK_REAR_LEFT_STATUS,
-                LOCK_REAR_RIGHT_STATUS,
-            ]:
-                if (
-                    self.coordinator.data[self.vin][VEHICLE_STATUS].get(door)
-                    == LOCK_LOCKED
-                ):
-                    continue
-                return False
-            return True
+            return vehicle.locks.all_locked
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return entity specific state attributes."""
         if self.lock_status_available:
-            if self.vin not in self.coordinator.data:
+            if not (vehicle := self.coordinator.vehicles.get(self.vin)):
                 return None
-            return {
-                LOCK_BOOT_STATUS: self.coordinator.data[self.vin][VEHICLE_STATUS].get(
-                    LOCK_BOOT_STATUS
-                ),
-                LOCK_FRONT_LEFT_STATUS: self.coordinator.data[self.vin][
-                    VEHICLE_STATUS
-                ].get(LOCK_FRONT_LEFT_STATUS),
-                LOCK_FRONT_RIGHT_STATUS: self.coordinator.data[self.vin][
-                    VEHICLE_STATUS
-                ].get(LOCK_FRONT_RIGHT_STATUS),
-                LOCK_REAR_LEFT_STATUS: self.coordinator.data[self.vin][
-                    VEHICLE_STATUS
-                ].get(LOCK_REAR_LEFT_STATUS),
-                LOCK_REAR_RIGHT_STATUS: self.coordinator.data[self.vin][
-                    VEHICLE_STATUS
-                ].get(LOCK_REAR_RIGHT_STATUS),
-            }
+            return vehicle.locks.doors
 
-    async def async_unlock_specific_door(self, door: str) -> None:
-        """Send the unlock command for a specified door."""
+    async def async_unlock_specific_door(self, door: str, refresh: bool = True) -> bool:
+        """
+        Send the unlock command for a specified door.
+
+        Returns True if the command completed within its time limit.
+        """
         _LOGGER.debug("Unlocking %s door for: %s", self, self.car_name)
         if self.lock_status_available:
             self._attr_is_unlocking = True
             self.async_write_ha_state()
         try:
-            await async_call_remote_service(
+            completed = await async_call_remote_service(
                 self.hass,
-                self.controller,
+                self.config_entry,
                 SERVICE_UNLOCK,
                 self.vehicle_info,
                 UNLOCK_VALID_DOORS[door],
-                self.config_entry.options.get(CONF_NOTIFICATION_OPTION),
+                refresh=refresh,
             )
         except HomeAssistantError as err:
             raise HomeAssistantError("Failed to unlock doors") from err
         finally:
             if self.lock_status_available:
                 self._attr_is_unlocking = False
-            self.coordinator.async_update_listeners()
+            self.async_write_ha_state()
+        return completed
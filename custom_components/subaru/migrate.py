@@ -5,30 +5,55 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from custom_components.subaru.binary_sensor import (
-    API_GEN_2_BINARY_SENSORS,
-    EV_BINARY_SENSORS,
-)
-from custom_components.subaru.button import (
-    EV_REMOTE_BUTTONS,
-    G1_REMOTE_BUTTONS,
-    RES_REMOTE_BUTTONS,
-)
-from custom_components.subaru.select import OLD_CLIMATE_SELECT
-from custom_components.subaru.sensor import (
-    API_GEN_2_SENSORS,
-    EV_SENSORS,
-    SAFETY_SENSORS,
-)
+import subarulink.const as sc
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor unique_ids used up to HA 2022.10 (e.g. "VIN_Range")
+LEGACY_SENSOR_REPLACEMENTS = {
+    "ODOMETER": sc.ODOMETER,
+    "AVG FUEL CONSUMPTION": sc.AVG_FUEL_CONSUMPTION,
+    "RANGE": sc.DIST_TO_EMPTY,
+    "TIRE PRESSURE FL": sc.TIRE_PRESSURE_FL,
+    "TIRE PRESSURE FR": sc.TIRE_PRESSURE_FR,
+    "TIRE PRESSURE RL": sc.TIRE_PRESSURE_RL,
+    "TIRE PRESSURE RR": sc.TIRE_PRESSURE_RR,
+    "FUEL LEVEL": sc.REMAINING_FUEL_PERCENT,
+    "EV RANGE": sc.EV_DISTANCE_TO_EMPTY,
+    "EV BATTERY LEVEL": sc.EV_STATE_OF_CHARGE_PERCENT,
+    "EV TIME TO FULL CHARGE": sc.EV_TIME_TO_FULLY_CHARGED_UTC,
+}
+
 
 async def async_migrate_entries(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Migrate entities from versions prior to 0.6.5 to use preferred unique_id."""
+    """
+    Migrate entities from versions prior to 0.6.5 to use preferred unique_id.
+
+    Called once per config entry, from config entry migration.
+    """
+    # pylint: disable=import-outside-toplevel
+    # Description tables are only needed here, so the platforms are not
+    # imported with the integration
+    from custom_components.subaru.binary_sensor import (
+        API_GEN_2_BINARY_SENSORS,
+        EV_BINARY_SENSORS,
+    )
+    from custom_components.subaru.button import (
+        EV_REMOTE_BUTTONS,
+        G1_REMOTE_BUTTONS,
+        RES_REMOTE_BUTTONS,
+    )
+    from custom_components.subaru.select import OLD_CLIMATE_SELECT
+    from custom_components.subaru.sensor import (
+        API_GEN_2_SENSORS,
+        EV_SENSORS,
+        SAFETY_SENSORS,
+    )
+
     entity_registry = er.async_get(hass)
 
     all_entities = []
@@ -48,12 +73,17 @@ async def async_migrate_entries(hass: HomeAssistant, config_entry: ConfigEntry)
     @callback
     def update_unique_id(entry: er.RegistryEntry) -> dict[str, Any] | None:
         id_split = entry.unique_id.split("_", maxsplit=1)
-        key = id_split[1].upper() if len(id_split) == 2 else None
+        if len(id_split) != 2:
+            return None
+        key = id_split[1].upper()
+        replacement = replacements.get(key)
+        if replacement is None and "_" not in key:
+            replacement = LEGACY_SENSOR_REPLACEMENTS.get(key)
 
-        if key not in replacements or id_split[1] == replacements[key]:
+        if replacement is None or id_split[1] == replacement:
             return None
 
-        new_unique_id = entry.unique_id.replace(id_split[1], replacements[key])
+        new_unique_id = entry.unique_id.replace(id_split[1], replacement)
         _LOGGER.debug(
             "Migrating entity '%s' unique_id from '%s' to '%s'",
             entry.entity_id,
@@ -0,0 +1,84 @@
+"""Account-wide rate limiting of MySubaru API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every MySubaru API call made for one account.
+
+    The bucket holds up to `capacity` tokens and regains one token every
+    `refill_seconds`. Each call consumes a token, waiting for one to become
+    available if the bucket is empty. Waiters are served in arrival order.
+    """
+
+    def __init__(self, capacity: int, refill_seconds: float) -> None:
+        """Initialize a full bucket."""
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.calls = 0
+        self.waits = 0
+        self.total_wait_time = 0.0
+        self.last_wait_time = 0.0
+
+    def set_limits(self, capacity: int, refill_seconds: float) -> None:
+        """Change bucket size and refill period, keeping the current level."""
+        self._refill()
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self._tokens = min(self._tokens, float(capacity))
+
+    @property
+    def tokens(self) -> float:
+        """Return the number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    async def async_acquire(self) -> None:
+        """Consume a token, waiting for the bucket to refill if necessary."""
+        async with self._lock:
+            self._refill()
+            wait_time = 0.0
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) * self.refill_seconds
+                _LOGGER.debug("Rate limit reached, waiting %.1f seconds", wait_time)
+                await asyncio.sleep(wait_time)
+                self._refill()
+                self.waits += 1
+                self.total_wait_time += wait_time
+            self.last_wait_time = wait_time
+            self._tokens -= 1
+            self.calls += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return current level and wait statistics for diagnostics."""
+        return {
+            "capacity": self.capacity,
+            "refill_seconds": self.refill_seconds,
+            "tokens": round(self.tokens, 2),
+            "calls": self.calls,
+            "waits": self.waits,
+            "total_wait_time": round(self.total_wait_time, 2),
+            "last_wait_time": round(self.last_wait_time, 2),
+        }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.refill_seconds > 0:
+            self._tokens = min(
+                float(self.capacity), self._tokens + elapsed / self.refill_seconds
+            )
+        else:
+            self._tokens = float(self.capacity)
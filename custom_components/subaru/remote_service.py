@@ -2,51 +2,280 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import Any
 
+import subarulink.const as sc
 from subarulink.controller import Controller
 from subarulink.exceptions import SubaruException
 
 from homeassistant.components import persistent_notification
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import (
+    COMMAND_STATE_FAILED,
+    COMMAND_STATE_QUEUED,
+    COMMAND_STATE_RUNNING,
+    COMMAND_STATE_SKIPPED,
+    COMMAND_STATE_SUCCESS,
+    COMMAND_TIMEOUT_OPTIONS,
+    COMMAND_TIMEOUTS,
+    CONF_COMMAND_DATA_MAX_AGE,
+    CONF_COMMAND_TIMEOUT_OTHER,
+    CONF_NOTIFICATION_OPTION,
+    CONF_SKIP_REDUNDANT_COMMANDS,
+    DEFAULT_COMMAND_TIMEOUT,
     DOMAIN,
+    ENTRY_COMMAND_LOCKS,
+    ENTRY_COMMAND_STATUS,
+    ENTRY_CONTROLLER,
+    ENTRY_COORDINATOR,
+    ENTRY_RATE_LIMITER,
     EVENT_SUBARU_COMMAND_FAIL,
+    EVENT_SUBARU_COMMAND_QUEUED,
     EVENT_SUBARU_COMMAND_SENT,
     EVENT_SUBARU_COMMAND_SUCCESS,
+    EVENT_SUBARU_COMMANDS_FINISHED,
     FETCH_INTERVAL,
+    REMOTE_SERVICE_CHARGE_START,
+    REMOTE_SERVICE_LOCK,
     REMOTE_SERVICE_POLL_VEHICLE,
     REMOTE_SERVICE_REFRESH,
     REMOTE_SERVICE_REMOTE_START,
+    REMOTE_SERVICE_REMOTE_STOP,
     REMOTE_SERVICE_UNLOCK,
+    SERVICE_RUN_COMMANDS,
+    SIGNAL_COMMAND_STATUS,
     UPDATE_INTERVAL,
-    VEHICLE_LAST_FETCH,
-    VEHICLE_LAST_UPDATE,
-    VEHICLE_NAME,
-    VEHICLE_VIN,
 )
+from .coordinator import LOCK_DOORS, VehicleData
 from .options import NotificationOptions
+from .rate_limiter import RateLimiter
+from .vehicle import VehicleInfo
 
 _LOGGER = logging.getLogger(__name__)
 
 
-# pylint: disable=too-many-positional-arguments
+def _all_locked(vehicle: VehicleData, arg: Any | None) -> bool:
+    return vehicle.locks.all_locked
+
+
+def _all_unlocked(vehicle: VehicleData, arg: Any | None) -> bool:
+    return arg == sc.ALL_DOORS and vehicle.locks.unlocked_count == len(LOCK_DOORS)
+
+
+def _engine_off(vehicle: VehicleData, arg: Any | None) -> bool:
+    return vehicle.status.get(sc.VEHICLE_STATE) == sc.IGNITION_OFF
+
+
+def _charging(vehicle: VehicleData, arg: Any | None) -> bool:
+    return vehicle.status.get(sc.EV_CHARGER_STATE_TYPE) == sc.CHARGING
+
+
+# Vehicle status checks that show a command would not change anything
+REDUNDANT_COMMAND_CHECKS = {
+    REMOTE_SERVICE_LOCK: _all_locked,
+    REMOTE_SERVICE_UNLOCK: _all_unlocked,
+    REMOTE_SERVICE_REMOTE_STOP: _engine_off,
+    REMOTE_SERVICE_CHARGE_START: _charging,
+}
+
+
 async def async_call_remote_service(
     hass: HomeAssistant,
-    controller: Controller,
+    config_entry: ConfigEntry,
+    cmd: str,
+    vehicle_info: VehicleInfo,
+    arg: Any | None,
+    *,
+    refresh: bool = True,
+) -> bool:
+    """
+    Execute subarulink remote command with optional start/end notification.
+
+    Commands for the same vehicle are queued and sent one at a time. Each runs
+    as a background task of the config entry. If it does not finish within its
+    time limit, return early and let it complete in the background. Its outcome
+    is then reported only through events/notifications and the command status.
+    Callers that refresh several vehicles together may pass refresh=False to
+    skip the fetch that normally follows the command. Returns True if the
+    command was sent and completed within its time limit, and raises if it
+    failed.
+    """
+    vin = vehicle_info.vin
+    if is_redundant_command(hass, config_entry, cmd, vehicle_info, arg):
+        _async_report_skipped(hass, config_entry, cmd, vehicle_info)
+        async_set_command_status(hass, config_entry, vin, COMMAND_STATE_SKIPPED, cmd)
+        return False
+
+    async_set_command_status(hass, config_entry, vin, COMMAND_STATE_QUEUED, cmd)
+    hass.bus.async_fire(
+        EVENT_SUBARU_COMMAND_QUEUED,
+        {"command": cmd, "car_name": vehicle_info.name},
+    )
+
+    timeout = get_command_timeout(config_entry, cmd)
+    task = config_entry.async_create_background_task(
+        hass,
+        _async_execute_remote_service(
+            hass, config_entry, cmd, vehicle_info, arg, refresh=refresh
+        ),
+        f"{DOMAIN} {cmd} {vin}",
+    )
+    try:
+        await asyncio.wait_for(asyncio.shield(task), timeout or None)
+    except TimeoutError:
+        _LOGGER.info(
+            "%s command for %s exceeded %s seconds, completing in background",
+            cmd,
+            vehicle_info.name,
+            timeout,
+        )
+        task.add_done_callback(_consume_background_result)
+        return False
+    return True
+
+
+def async_set_command_status(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    vin: str,
+    state: str,
+    cmd: str,
+    message: str | None = None,
+) -> None:
+    """Record progress of the latest command for a vehicle and notify listeners."""
+    hass.data[DOMAIN][config_entry.entry_id][ENTRY_COMMAND_STATUS][vin] = {
+        "state": state,
+        "command": cmd,
+        "message": message,
+    }
+    async_dispatcher_send(
+        hass, SIGNAL_COMMAND_STATUS.format(config_entry.entry_id, vin)
+    )
+
+
+async def async_update_vehicle_data(
+    hass: HomeAssistant, config_entry: ConfigEntry, vehicle_info: VehicleInfo
+) -> None:
+    """Pass the vehicle data fetched after a command to the coordinator."""
+    entry = hass.data[DOMAIN][config_entry.entry_id]
+    try:
+        data = await entry[ENTRY_CONTROLLER].get_data(vehicle_info.vin)
+    except SubaruException as err:
+        _LOGGER.warning("Unable to read data of %s: %s", vehicle_info.name, err.message)
+        return
+    entry[ENTRY_COORDINATOR].async_update_vehicle(vehicle_info.vin, data)
+
+
+def is_redundant_command(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
     cmd: str,
-    vehicle_info: dict,
+    vehicle_info: VehicleInfo,
     arg: Any | None,
-    notify_option: str,
+) -> bool:
+    """Return True if recent vehicle data shows the command would change nothing."""
+    if not config_entry.options.get(CONF_SKIP_REDUNDANT_COMMANDS):
+        return False
+    if not (check := REDUNDANT_COMMAND_CHECKS.get(cmd)):
+        return False
+    max_age = config_entry.options.get(CONF_COMMAND_DATA_MAX_AGE, FETCH_INTERVAL)
+    if time.time() - vehicle_info.schedule.last_fetch > max_age:
+        return False
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][ENTRY_COORDINATOR]
+    if not (vehicle := coordinator.vehicles.get(vehicle_info.vin)):
+        return False
+    return check(vehicle, arg)
+
+
+def _async_report_skipped(
+    hass: HomeAssistant, config_entry: ConfigEntry, cmd: str, vehicle_info: VehicleInfo
 ) -> None:
-    """Execute subarulink remote command with optional start/end notification."""
-    car_name = vehicle_info[VEHICLE_NAME]
-    vin = vehicle_info[VEHICLE_VIN]
-    notify = NotificationOptions.get_by_value(notify_option)
+    """Report a command that was not sent because it would change nothing."""
+    car_name = vehicle_info.name
+    notify = NotificationOptions.get_by_value(
+        config_entry.options.get(CONF_NOTIFICATION_OPTION)
+    )
+    if notify == NotificationOptions.SUCCESS:
+        persistent_notification.create(
+            hass,
+            f"{cmd} command skipped for {car_name}: vehicle is already in requested state",
+            "Subaru",
+        )
+    hass.bus.async_fire(
+        EVENT_SUBARU_COMMAND_SUCCESS,
+        {"command": cmd, "car_name": car_name, "skipped": True},
+    )
+    _LOGGER.debug("%s command skipped for %s, nothing to change", cmd, car_name)
+
+
+def get_command_timeout(config_entry: ConfigEntry, cmd: str) -> float:
+    """Return time limit for a command, or 0 if unlimited."""
+    option = COMMAND_TIMEOUT_OPTIONS.get(cmd, CONF_COMMAND_TIMEOUT_OTHER)
+    if (timeout := config_entry.options.get(option)) is None:
+        return COMMAND_TIMEOUTS.get(cmd, DEFAULT_COMMAND_TIMEOUT)
+    return timeout
+
+
+def _consume_background_result(task: asyncio.Task) -> None:
+    """Retrieve the result of a command that finished after its time limit."""
+    if not task.cancelled() and (err := task.exception()):
+        _LOGGER.debug("Background command finished with error: %s", err)
+
+
+async def _async_execute_remote_service(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    cmd: str,
+    vehicle_info: VehicleInfo,
+    arg: Any | None,
+    *,
+    refresh: bool,
+) -> None:
+    """Wait for the vehicle's command queue, then send the command."""
+    vin = vehicle_info.vin
+    async with hass.data[DOMAIN][config_entry.entry_id][ENTRY_COMMAND_LOCKS][vin]:
+        async_set_command_status(hass, config_entry, vin, COMMAND_STATE_RUNNING, cmd)
+        try:
+            await _async_send_remote_command(
+                hass, config_entry, cmd, vehicle_info, arg, refresh=refresh
+            )
+        except HomeAssistantError as err:
+            async_set_command_status(
+                hass, config_entry, vin, COMMAND_STATE_FAILED, cmd, str(err)
+            )
+            raise
+        except asyncio.CancelledError:
+            async_set_command_status(
+                hass, config_entry, vin, COMMAND_STATE_FAILED, cmd, "Command cancelled"
+            )
+            raise
+        async_set_command_status(hass, config_entry, vin, COMMAND_STATE_SUCCESS, cmd)
+
+
+async def _async_send_remote_command(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    cmd: str,
+    vehicle_info: VehicleInfo,
+    arg: Any | None,
+    *,
+    refresh: bool,
+) -> None:
+    """Send remote command, refresh data and report the outcome."""
+    entry = hass.data[DOMAIN][config_entry.entry_id]
+    controller: Controller = entry[ENTRY_CONTROLLER]
+    rate_limiter: RateLimiter = entry[ENTRY_RATE_LIMITER]
+    car_name = vehicle_info.name
+    notify = NotificationOptions.get_by_value(
+        config_entry.options.get(CONF_NOTIFICATION_OPTION)
+    )
     if notify in [NotificationOptions.PENDING, NotificationOptions.SUCCESS]:
         persistent_notification.create(
             hass,
@@ -61,20 +290,24 @@ async def async_call_remote_service(
     success = False
     err_msg = ""
     try:
-        if cmd == REMOTE_SERVICE_POLL_VEHICLE:
-            success = await poll_subaru(vehicle_info, controller, update_interval=0)
-        elif cmd in [REMOTE_SERVICE_REMOTE_START, REMOTE_SERVICE_UNLOCK]:
-            success = await getattr(controller, cmd)(vin, arg)
-        elif cmd == REMOTE_SERVICE_REFRESH:
-            success = True
-        else:
-            success = await getattr(controller, cmd)(vin)
-
+        success = await _async_send_command(
+            controller, rate_limiter, cmd, vehicle_info, arg
+        )
     except SubaruException as err:
         err_msg = err.message
 
-    finally:
-        await refresh_subaru(vehicle_info, controller, refresh_interval=0)
+    except asyncio.CancelledError:
+        if notify in [NotificationOptions.PENDING, NotificationOptions.SUCCESS]:
+            persistent_notification.dismiss(hass, DOMAIN)
+        hass.bus.async_fire(
+            EVENT_SUBARU_COMMAND_FAIL,
+            {"command": cmd, "car_name": car_name, "message": "Command cancelled"},
+        )
+        raise
+
+    if refresh:
+        await refresh_subaru(vehicle_info, controller, rate_limiter, refresh_interval=0)
+        await async_update_vehicle_data(hass, config_entry, vehicle_info)
 
     if notify in [NotificationOptions.PENDING, NotificationOptions.SUCCESS]:
         persistent_notification.dismiss(hass, DOMAIN)
@@ -103,30 +336,162 @@ async def async_call_remote_service(
     raise HomeAssistantError(f"Service {cmd} failed for {car_name}: {err_msg}")
 
 
-async def poll_subaru(vehicle, controller, update_interval=UPDATE_INTERVAL):
+async def async_run_remote_commands(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    vehicle_info: VehicleInfo,
+    commands: list[tuple[str, Any | None]],
+) -> None:
+    """
+    Send a sequence of commands to one vehicle as a single operation.
+
+    Commands are sent in order while holding the vehicle's command queue, and
+    the sequence stops at the first failure. One notification and one
+    EVENT_SUBARU_COMMANDS_FINISHED event report the outcome, and vehicle data
+    is refreshed once at the end.
+    """
+    entry = hass.data[DOMAIN][config_entry.entry_id]
+    controller: Controller = entry[ENTRY_CONTROLLER]
+    rate_limiter: RateLimiter = entry[ENTRY_RATE_LIMITER]
+    car_name = vehicle_info.name
+    vin = vehicle_info.vin
+    names = [cmd for cmd, _ in commands]
+    summary = ", ".join(names)
+    notify = NotificationOptions.get_by_value(
+        config_entry.options.get(CONF_NOTIFICATION_OPTION)
+    )
+
+    async_set_command_status(
+        hass, config_entry, vin, COMMAND_STATE_QUEUED, SERVICE_RUN_COMMANDS
+    )
+    async with entry[ENTRY_COMMAND_LOCKS][vin]:
+        async_set_command_status(
+            hass, config_entry, vin, COMMAND_STATE_RUNNING, SERVICE_RUN_COMMANDS
+        )
+        if notify in [NotificationOptions.PENDING, NotificationOptions.SUCCESS]:
+            persistent_notification.create(
+                hass,
+                f"Sending {summary} commands to {car_name}",
+                "Subaru",
+                DOMAIN,
+            )
+        completed: list[str] = []
+        err_msg = ""
+        for cmd, arg in commands:
+            _LOGGER.debug("Sending %s command to %s", cmd, car_name)
+            try:
+                success = await _async_send_command(
+                    controller, rate_limiter, cmd, vehicle_info, arg
+                )
+            except SubaruException as err:
+                success = False
+                err_msg = err.message
+            if not success:
+                break
+            completed.append(cmd)
+
+        try:
+            await refresh_subaru(
+                vehicle_info, controller, rate_limiter, refresh_interval=0
+            )
+        except SubaruException as err:
+            _LOGGER.warning("Unable to refresh %s: %s", car_name, err.message)
+        await async_update_vehicle_data(hass, config_entry, vehicle_info)
+
+        if notify in [NotificationOptions.PENDING, NotificationOptions.SUCCESS]:
+            persistent_notification.dismiss(hass, DOMAIN)
+
+        event_data = {
+            "car_name": car_name,
+            "commands": names,
+            "completed": completed,
+            "success": len(completed) == len(commands),
+        }
+        if event_data["success"]:
+            if notify == NotificationOptions.SUCCESS:
+                persistent_notification.create(
+                    hass, f"{summary} commands completed for {car_name}", "Subaru"
+                )
+            hass.bus.async_fire(EVENT_SUBARU_COMMANDS_FINISHED, event_data)
+            async_set_command_status(
+                hass, config_entry, vin, COMMAND_STATE_SUCCESS, SERVICE_RUN_COMMANDS
+            )
+            return
+
+        failed = names[len(completed)]
+        event_data["failed_command"] = failed
+        event_data["message"] = err_msg
+        if notify != NotificationOptions.DISABLE:
+            persistent_notification.create(
+                hass, f"{failed} command failed for {car_name}: {err_msg}", "Subaru"
+            )
+        hass.bus.async_fire(EVENT_SUBARU_COMMANDS_FINISHED, event_data)
+        async_set_command_status(
+            hass,
+            config_entry,
+            vin,
+            COMMAND_STATE_FAILED,
+            SERVICE_RUN_COMMANDS,
+            f"{failed}: {err_msg}",
+        )
+        raise HomeAssistantError(f"Service {failed} failed for {car_name}: {err_msg}")
+
+
+async def _async_send_command(
+    controller: Controller,
+    rate_limiter: RateLimiter,
+    cmd: str,
+    vehicle_info: VehicleInfo,
+    arg: Any | None,
+) -> bool:
+    """Call the subarulink method for a command and return its result."""
+    vin = vehicle_info.vin
+    if cmd == REMOTE_SERVICE_POLL_VEHICLE:
+        return await poll_subaru(
+            vehicle_info, controller, rate_limiter, update_interval=0
+        )
+    if cmd == REMOTE_SERVICE_REFRESH:
+        return True
+    await rate_limiter.async_acquire()
+    if cmd in [REMOTE_SERVICE_REMOTE_START, REMOTE_SERVICE_UNLOCK]:
+        return await getattr(controller, cmd)(vin, arg)
+    return await getattr(controller, cmd)(vin)
+
+
+async def poll_subaru(
+    vehicle: VehicleInfo,
+    controller,
+    rate_limiter: RateLimiter,
+    update_interval=UPDATE_INTERVAL,
+):
     """Commands remote vehicle update (polls the vehicle to update subaru API cache)."""
     cur_time = time.time()
-    last_update = vehicle[VEHICLE_LAST_UPDATE]
+    last_update = vehicle.schedule.last_update
     success = False
 
     if (cur_time - last_update) > update_interval:
-        success = await controller.update(vehicle[VEHICLE_VIN], force=True)
-        vehicle[VEHICLE_LAST_UPDATE] = cur_time
+        await rate_limiter.async_acquire()
+        success = await controller.update(vehicle.vin, force=True)
+        vehicle.schedule.last_update = cur_time
 
     return success
 
 
 async def refresh_subaru(
-    vehicle: dict, controller: Controller, refresh_interval: int = FETCH_INTERVAL
+    vehicle: VehicleInfo,
+    controller: Controller,
+    rate_limiter: RateLimiter,
+    refresh_interval: int = FETCH_INTERVAL,
 ) -> bool:
     """Refresh data from Subaru servers."""
     cur_time = time.time()
-    last_fetch = vehicle[VEHICLE_LAST_FETCH]
-    vin = vehicle[VEHICLE_VIN]
+    last_fetch = vehicle.schedule.last_fetch
+    vin = vehicle.vin
     success = False
 
     if (cur_time - last_fetch) > refresh_interval:
+        await rate_limiter.async_acquire()
         success = await controller.fetch(vin, force=True)
-        vehicle[VEHICLE_LAST_FETCH] = cur_time
+        vehicle.schedule.last_fetch = cur_time
 
     return success
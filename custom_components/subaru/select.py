@@ -9,20 +9,17 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     DOMAIN as SUBARU_DOMAIN,
     ENTRY_COORDINATOR,
     ENTRY_VEHICLES,
     VEHICLE_CLIMATE,
-    VEHICLE_CLIMATE_PRESET_NAME,
-    VEHICLE_CLIMATE_SELECTED_PRESET,
-    VEHICLE_HAS_EV,
-    VEHICLE_HAS_REMOTE_START,
-    VEHICLE_VIN,
 )
+from .coordinator import SubaruDataUpdateCoordinator
 from .device import get_device_info
+from .entity import SubaruStateWriteLimit
+from .vehicle import VehicleInfo
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,53 +41,49 @@ async def async_setup_entry(
     vehicle_info = entry[ENTRY_VEHICLES]
     climate_select = []
     for info in vehicle_info.values():
-        if info[VEHICLE_HAS_REMOTE_START] or info[VEHICLE_HAS_EV]:
+        if info.has_remote_start or info.has_ev:
             climate_select.append(SubaruClimateSelect(info, config_entry, coordinator))
     async_add_entities(climate_select)
 
 
-class SubaruClimateSelect(SelectEntity, RestoreEntity):
+class SubaruClimateSelect(SubaruStateWriteLimit, SelectEntity, RestoreEntity):
     """Representation of a Subaru climate preset selector entity."""
 
     _attr_has_entity_name = True
 
     def __init__(
         self,
-        vehicle_info: dict,
+        vehicle_info: VehicleInfo,
         config_entry: ConfigEntry,
-        coordinator: DataUpdateCoordinator,
+        coordinator: SubaruDataUpdateCoordinator,
     ) -> None:
         """Initialize the selector for the vehicle."""
         self.coordinator = coordinator
-        self.vin = vehicle_info[VEHICLE_VIN]
+        self.vin = vehicle_info.vin
         self.config_entry = config_entry
         self.entity_description = CLIMATE_SELECT
-        self._attr_current_option = ""
         self._attr_device_info = get_device_info(vehicle_info)
         self._attr_unique_id = f"{self.vin}_{self.entity_description.key}"
 
     @property
     def options(self) -> list:
         """Return a set of selectable options."""
-        vehicle_data = None
-        if self.coordinator.data:
-            vehicle_data = self.coordinator.data.get(self.vin)
-        if vehicle_data:
-            if isinstance(
-                preset_data := vehicle_data.get(self.entity_description.key), list
-            ):
-                return [preset[VEHICLE_CLIMATE_PRESET_NAME] for preset in preset_data]
+        if vehicle := self.coordinator.vehicles.get(self.vin):
+            return vehicle.presets.names
         return []
 
+    @property
+    def current_option(self) -> str:
+        """Return the selected option."""
+        return self.coordinator.get_selected_preset(self.vin) or ""
+
     async def async_added_to_hass(self) -> None:
-        """Restore previous state of this selector."""
+        """Restore a selection made before selections were stored."""
         await super().async_added_to_hass()
+        if self.coordinator.get_selected_preset(self.vin) is not None:
+            return
         state = await self.async_get_last_state()
-        if state and (state.state in self.options):
-            self._attr_current_option = state.state
-            self.coordinator.data.get(self.vin)[
-                VEHICLE_CLIMATE_SELECTED_PRESET
-            ] = state.state
+        if state and self.coordinator.select_preset(self.vin, state.state):
             self.async_write_ha_state()
 
     async def async_select_option(self, option: str) -> None:
@@ -98,9 +91,5 @@ class SubaruClimateSelect(SelectEntity, RestoreEntity):
         _LOGGER.debug(
             "Selecting %s climate preset for %s", option, self.device_info["name"]
         )
-        if option in self.options:
-            self._attr_current_option = option
-            self.coordinator.data.get(self.vin)[
-                VEHICLE_CLIMATE_SELECTED_PRESET
-            ] = option
+        if self.coordinator.select_preset(self.vin, option):
             self.async_write_ha_state()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from itertools import product
 import logging
 from typing import Any
 
@@ -14,35 +16,31 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfLength, UnitOfPressure, UnitOfVolume
+from homeassistant.const import PERCENTAGE, UnitOfLength, UnitOfPressure
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
-from homeassistant.util.unit_conversion import (
-    DistanceConverter,
-    PressureConverter,
-    VolumeConverter,
-)
-from homeassistant.util.unit_system import METRIC_SYSTEM
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     API_GEN_2,
     API_GEN_3,
     API_GEN_4,
+    COMMAND_STATES,
+    CONF_DEADBAND_FUEL_CONSUMPTION,
+    CONF_DEADBAND_FUEL_LEVEL,
+    CONF_DEADBAND_TIRE_PRESSURE,
     DOMAIN,
+    ENTRY_COMMAND_STATUS,
     ENTRY_COORDINATOR,
     ENTRY_VEHICLES,
-    VEHICLE_API_GEN,
-    VEHICLE_HAS_EV,
-    VEHICLE_HAS_TPMS,
-    VEHICLE_STATUS,
-    VEHICLE_VIN,
+    SENSOR_DEADBANDS,
+    SIGNAL_COMMAND_STATUS,
 )
+from .coordinator import SubaruDataUpdateCoordinator
 from .device import get_device_info
+from .entity import SubaruStateWriteLimit, async_add_reported_entities
+from .vehicle import VehicleInfo
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,12 +49,26 @@ _LOGGER = logging.getLogger(__name__)
 FUEL_CONSUMPTION_LITERS_PER_HUNDRED_KILOMETERS = "L/100km"
 FUEL_CONSUMPTION_MILES_PER_GALLON = "mi/gal"
 
-L_PER_GAL = VolumeConverter.convert(1, UnitOfVolume.GALLONS, UnitOfVolume.LITERS)
-KM_PER_MI = DistanceConverter.convert(1, UnitOfLength.MILES, UnitOfLength.KILOMETERS)
+
+@dataclass(frozen=True, kw_only=True)
+class SubaruSensorEntityDescription(SensorEntityDescription):
+    """
+    Describes a Subaru sensor.
+
+    Values are rounded to the nearest multiple of `rounding_step`, and the
+    state only changes once the rounded value has moved at least the deadband
+    set by the `deadband_option` config entry option (both in the sensor's
+    native unit) from the current state. The exact values remain in the
+    vehicle data included in diagnostics.
+    """
+
+    deadband_option: str | None = None
+    rounding_step: float | None = None
+
 
 # Sensor available for Gen1 or Gen2 vehicles
 SAFETY_SENSORS = [
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.ODOMETER,
         translation_key="odometer",
         device_class=SensorDeviceClass.DISTANCE,
@@ -68,14 +80,16 @@ SAFETY_SENSORS = [
 
 # Sensors available to subscribers with Gen2/Gen3/Gen4 vehicles
 API_GEN_2_SENSORS = [
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.AVG_FUEL_CONSUMPTION,
         translation_key="average_fuel_consumption",
         icon="mdi:leaf",
         native_unit_of_measurement=FUEL_CONSUMPTION_MILES_PER_GALLON,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband_option=CONF_DEADBAND_FUEL_CONSUMPTION,
+        rounding_step=0.1,
     ),
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.DIST_TO_EMPTY,
         translation_key="range",
         device_class=SensorDeviceClass.DISTANCE,
@@ -87,50 +101,60 @@ API_GEN_2_SENSORS = [
 
 # Sensors available to subscribers with TPMS equipped vehicles
 TPMS_SENSORS = [
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.TIRE_PRESSURE_FL,
         translation_key="tire_pressure_front_left",
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.PSI,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband_option=CONF_DEADBAND_TIRE_PRESSURE,
+        rounding_step=0.1,
     ),
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.TIRE_PRESSURE_FR,
         translation_key="tire_pressure_front_right",
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.PSI,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband_option=CONF_DEADBAND_TIRE_PRESSURE,
+        rounding_step=0.1,
     ),
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.TIRE_PRESSURE_RL,
         translation_key="tire_pressure_rear_left",
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.PSI,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband_option=CONF_DEADBAND_TIRE_PRESSURE,
+        rounding_step=0.1,
     ),
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.TIRE_PRESSURE_RR,
         translation_key="tire_pressure_rear_right",
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.PSI,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband_option=CONF_DEADBAND_TIRE_PRESSURE,
+        rounding_step=0.1,
     ),
 ]
 
 # Sensors available for Gen3/Gen4 vehicles
 API_GEN_3_SENSORS = [
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.REMAINING_FUEL_PERCENT,
         translation_key="fuel_level",
         icon="mdi:gas-station",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband_option=CONF_DEADBAND_FUEL_LEVEL,
+        rounding_step=1,
     ),
 ]
 
 # Sensors available to subscribers with PHEV vehicles
 EV_SENSORS = [
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.EV_DISTANCE_TO_EMPTY,
         translation_key="ev_range",
         device_class=SensorDeviceClass.DISTANCE,
@@ -138,20 +162,29 @@ EV_SENSORS = [
         native_unit_of_measurement=UnitOfLength.MILES,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.EV_STATE_OF_CHARGE_PERCENT,
         translation_key="ev_battery_level",
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    SubaruSensorEntityDescription(
         key=sc.EV_TIME_TO_FULLY_CHARGED_UTC,
         translation_key="ev_time_to_full_charge",
         device_class=SensorDeviceClass.TIMESTAMP,
     ),
 ]
 
+# Sensor available for vehicles with remote services
+COMMAND_STATUS_SENSOR = SensorEntityDescription(
+    key="command_status",
+    translation_key="command_status",
+    icon="mdi:car-clock",
+    device_class=SensorDeviceClass.ENUM,
+    options=COMMAND_STATES,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -162,128 +195,149 @@ async def async_setup_entry(
     entry = hass.data[DOMAIN][config_entry.entry_id]
     coordinator = entry[ENTRY_COORDINATOR]
     vehicle_info = entry[ENTRY_VEHICLES]
-    entities = []
-    await _async_migrate_entries(hass, config_entry)
+    sensors = []
+    command_status_sensors = []
     for info in vehicle_info.values():
-        entities.extend(create_vehicle_sensors(info, coordinator))
-    async_add_entities(entities)
+        sensors.extend(create_vehicle_sensors(info, coordinator))
+        if info.has_remote_service:
+            command_status_sensors.append(SubaruCommandStatusSensor(info, config_entry))
+    async_add_entities(command_status_sensors)
+    async_add_reported_entities(
+        config_entry, coordinator, async_add_entities, sensors, _is_reported
+    )
+
+
+def _is_reported(sensor: SubaruSensor, initial: bool) -> bool:
+    """
+    Return True once the vehicle has reported a valid value for the sensor.
+
+    If no data has been received for the vehicle at setup, sensors are created
+    right away (and unavailable) so a failed first fetch does not hide them.
+    Later updates without the vehicle's data do not add held back sensors.
+    """
+    if not (vehicle := sensor.coordinator.vehicles.get(sensor.vin)):
+        return initial
+    return sensor.entity_description.key in vehicle.status
+
+
+def _sensor_descriptions(
+    api_gen_2: bool, api_gen_3: bool, has_ev: bool, has_tpms: bool
+) -> tuple[SubaruSensorEntityDescription, ...]:
+    """Return the sensor descriptions for one combination of capabilities."""
+    descriptions = [*SAFETY_SENSORS]
+    if api_gen_2:
+        descriptions.extend(API_GEN_2_SENSORS)
+    if api_gen_3:
+        descriptions.extend(API_GEN_3_SENSORS)
+    if has_ev:
+        descriptions.extend(EV_SENSORS)
+    if has_tpms:
+        descriptions.extend(TPMS_SENSORS)
+    return tuple(descriptions)
+
+
+# Sensor descriptions for every capability signature, built once at import
+SENSOR_DESCRIPTIONS = {
+    signature: _sensor_descriptions(*signature)
+    for signature in product((False, True), repeat=4)
+}
 
 
 def create_vehicle_sensors(
-    vehicle_info, coordinator: DataUpdateCoordinator
+    vehicle_info: VehicleInfo, coordinator: SubaruDataUpdateCoordinator
 ) -> list[SubaruSensor]:
     """Instantiate all available sensors for the vehicle."""
-    sensor_descriptions_to_add = []
-    sensor_descriptions_to_add.extend(SAFETY_SENSORS)
-
-    if vehicle_info[VEHICLE_API_GEN] in [API_GEN_2, API_GEN_3, API_GEN_4]:
-        sensor_descriptions_to_add.extend(API_GEN_2_SENSORS)
-
-    if vehicle_info[VEHICLE_API_GEN] in [API_GEN_3, API_GEN_4]:
-        sensor_descriptions_to_add.extend(API_GEN_3_SENSORS)
-
-    if vehicle_info[VEHICLE_HAS_EV]:
-        sensor_descriptions_to_add.extend(EV_SENSORS)
-
-    if vehicle_info[VEHICLE_HAS_TPMS]:
-        sensor_descriptions_to_add.extend(TPMS_SENSORS)
-
+    signature = (
+        vehicle_info.api_gen in [API_GEN_2, API_GEN_3, API_GEN_4],
+        vehicle_info.api_gen in [API_GEN_3, API_GEN_4],
+        bool(vehicle_info.has_ev),
+        bool(vehicle_info.has_tpms),
+    )
     return [
         SubaruSensor(
             vehicle_info,
             coordinator,
             description,
         )
-        for description in sensor_descriptions_to_add
+        for description in SENSOR_DESCRIPTIONS[signature]
     ]
 
 
 class SubaruSensor(
-    CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity
+    SubaruStateWriteLimit, CoordinatorEntity[SubaruDataUpdateCoordinator], SensorEntity
 ):
     """Class for Subaru sensors."""
 
+    entity_description: SubaruSensorEntityDescription
+
     _attr_has_entity_name = True
 
     def __init__(
         self,
-        vehicle_info: dict,
-        coordinator: DataUpdateCoordinator,
-        description: SensorEntityDescription,
+        vehicle_info: VehicleInfo,
+        coordinator: SubaruDataUpdateCoordinator,
+        description: SubaruSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.vin = vehicle_info[VEHICLE_VIN]
+        super().__init__(coordinator, context=vehicle_info.vin)
+        self.vin = vehicle_info.vin
         self.entity_description = description
         self._attr_device_info = get_device_info(vehicle_info)
         self._attr_unique_id = f"{self.vin}_{description.key}"
+        self._attr_native_unit_of_measurement = description.native_unit_of_measurement
 
-    @property
-    def native_value(self) -> int | float | None:
-        """Return the state of the sensor."""
-        current_value = self.coordinator.data[self.vin][VEHICLE_STATUS].get(
-            self.entity_description.key
-        )
+    async def async_added_to_hass(self) -> None:
+        """Compute initial state when added to hass."""
+        await super().async_added_to_hass()
+        self._update_values()
 
-        if (
-            self.entity_description.key == sc.AVG_FUEL_CONSUMPTION
-            and self.hass.config.units == METRIC_SYSTEM
-        ):
-            return round((100.0 * L_PER_GAL) / (KM_PER_MI * current_value), 1)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute state from new coordinator data, then write it."""
+        self._update_values()
+        super()._handle_coordinator_update()
+
+    def _update_values(self) -> None:
+        """Look up value, unit and attributes once per data update."""
+        if not (vehicle := self.coordinator.vehicles.get(self.vin)):
+            return
+        key = self.entity_description.key
+        if key == sc.AVG_FUEL_CONSUMPTION and vehicle.metric:
+            unit = FUEL_CONSUMPTION_LITERS_PER_HUNDRED_KILOMETERS
+        else:
+            unit = self.entity_description.native_unit_of_measurement
+        self._attr_native_value = self._filter_value(
+            vehicle.status.get(key), unit == self._attr_native_unit_of_measurement
+        )
+        self._attr_native_unit_of_measurement = unit
 
-        return current_value
+        # Provide recommended tire pressure
+        if key in [sc.TIRE_PRESSURE_FL, sc.TIRE_PRESSURE_FR]:
+            self._attr_extra_state_attributes = vehicle.tire_pressure_attributes[
+                sc.HEALTH_RECOMMENDED_TIRE_PRESSURE_FRONT
+            ]
+        elif key in [sc.TIRE_PRESSURE_RL, sc.TIRE_PRESSURE_RR]:
+            self._attr_extra_state_attributes = vehicle.tire_pressure_attributes[
+                sc.HEALTH_RECOMMENDED_TIRE_PRESSURE_REAR
+            ]
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit_of_measurement of the device."""
+    def _filter_value(self, value: Any, same_unit: bool) -> Any:
+        """Apply the description's rounding step and deadband to a new value."""
+        description = self.entity_description
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return value
+        if step := description.rounding_step:
+            value = round(round(value / step) * step, 6)
+        current = self._attr_native_value
         if (
-            self.entity_description.key == sc.AVG_FUEL_CONSUMPTION
-            and self.hass.config.units == METRIC_SYSTEM
+            same_unit
+            and (option := description.deadband_option)
+            and isinstance(current, (int, float))
+            and abs(value - current)
+            < self.platform.config_entry.options.get(option, SENSOR_DEADBANDS[option])
         ):
-            return FUEL_CONSUMPTION_LITERS_PER_HUNDRED_KILOMETERS
-        return self.entity_description.native_unit_of_measurement
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return entity specific state attributes."""
-        extra_attributes = None
-        unit_system = self.hass.config.units
-
-        # Provide recommended tire pressure
-        if self.device_class == SensorDeviceClass.PRESSURE:
-            info = self.coordinator.data[self.vin][sc.VEHICLE_HEALTH][
-                sc.HEALTH_RECOMMENDED_TIRE_PRESSURE
-            ]
-            if self.entity_description.key in [
-                sc.TIRE_PRESSURE_FL,
-                sc.TIRE_PRESSURE_FR,
-            ]:
-                if value := info.get(sc.HEALTH_RECOMMENDED_TIRE_PRESSURE_FRONT):
-                    if unit_system == METRIC_SYSTEM:
-                        value = round(
-                            PressureConverter.convert(
-                                value, UnitOfPressure.PSI, UnitOfPressure.KPA
-                            ),
-                            0,
-                        )
-
-                extra_attributes = {"Recommended pressure": value}
-            if self.entity_description.key in [
-                sc.TIRE_PRESSURE_RL,
-                sc.TIRE_PRESSURE_RR,
-            ]:
-                if value := info.get(sc.HEALTH_RECOMMENDED_TIRE_PRESSURE_REAR):
-                    if unit_system == METRIC_SYSTEM:
-                        value = round(
-                            PressureConverter.convert(
-                                value, UnitOfPressure.PSI, UnitOfPressure.KPA
-                            ),
-                            0,
-                        )
-
-                extra_attributes = {"Recommended pressure": value}
-
-        return extra_attributes
+            return current
+        return value
 
     @property
     def available(self) -> bool:
@@ -294,52 +348,45 @@ class SubaruSensor(
         return last_update_success
 
 
-async def _async_migrate_entries(
-    hass: HomeAssistant, config_entry: ConfigEntry
-) -> None:
-    """Migrate sensor entries from HA<=2022.10 to use preferred unique_id."""
-    entity_registry = er.async_get(hass)
-
-    replacements = {
-        "ODOMETER": sc.ODOMETER,
-        "AVG FUEL CONSUMPTION": sc.AVG_FUEL_CONSUMPTION,
-        "RANGE": sc.DIST_TO_EMPTY,
-        "TIRE PRESSURE FL": sc.TIRE_PRESSURE_FL,
-        "TIRE PRESSURE FR": sc.TIRE_PRESSURE_FR,
-        "TIRE PRESSURE RL": sc.TIRE_PRESSURE_RL,
-        "TIRE PRESSURE RR": sc.TIRE_PRESSURE_RR,
-        "FUEL LEVEL": sc.REMAINING_FUEL_PERCENT,
-        "EV RANGE": sc.EV_DISTANCE_TO_EMPTY,
-        "EV BATTERY LEVEL": sc.EV_STATE_OF_CHARGE_PERCENT,
-        "EV TIME TO FULL CHARGE": sc.EV_TIME_TO_FULLY_CHARGED_UTC,
-    }
+class SubaruCommandStatusSensor(SensorEntity):
+    """Progress of the latest remote command sent to a vehicle."""
 
-    @callback
-    def update_unique_id(entry: er.RegistryEntry) -> dict[str, Any] | None:
-        id_split = entry.unique_id.split("_")
-        key = id_split[1].upper() if len(id_split) == 2 else None
-
-        if key not in replacements or id_split[1] == replacements[key]:
-            return None
-
-        new_unique_id = entry.unique_id.replace(id_split[1], replacements[key])
-        _LOGGER.debug(
-            "Migrating entity '%s' unique_id from '%s' to '%s'",
-            entry.entity_id,
-            entry.unique_id,
-            new_unique_id,
-        )
-        if existing_entity_id := entity_registry.async_get_entity_id(
-            entry.domain, entry.platform, new_unique_id
-        ):
-            _LOGGER.debug(
-                "Cannot migrate to unique_id '%s', already exists for '%s'",
-                new_unique_id,
-                existing_entity_id,
-            )
-            return None
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    entity_description = COMMAND_STATUS_SENSOR
+
+    def __init__(self, vehicle_info: VehicleInfo, config_entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        self.vin = vehicle_info.vin
+        self.config_entry = config_entry
+        self._attr_device_info = get_device_info(vehicle_info)
+        self._attr_unique_id = f"{self.vin}_{COMMAND_STATUS_SENSOR.key}"
+
+    @property
+    def _status(self) -> dict[str, Any]:
+        return self.hass.data[DOMAIN][self.config_entry.entry_id][ENTRY_COMMAND_STATUS][
+            self.vin
+        ]
+
+    @property
+    def native_value(self) -> str:
+        """Return the state of the latest command."""
+        return self._status["state"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the latest command and failure message."""
         return {
-            "new_unique_id": new_unique_id,
+            "command": self._status["command"],
+            "message": self._status["message"],
         }
 
-    await er.async_migrate_entries(hass, config_entry.entry_id, update_unique_id)
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to command status updates."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_COMMAND_STATUS.format(self.config_entry.entry_id, self.vin),
+                self.async_write_ha_state,
+            )
+        )
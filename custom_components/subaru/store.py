@@ -0,0 +1,45 @@
+"""Persistent per-vehicle choices of the Subaru integration."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_KEY, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+
+class SelectedPresetStore:
+    """
+    Climate preset selected for remote start of each vehicle in an account.
+
+    Selections are read from memory and written to storage in the background,
+    so they survive restarts independently of coordinator data.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize an empty store for a config entry."""
+        self._store: Store[dict[str, str]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id)
+        )
+        self._presets: dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the saved selections."""
+        self._presets = await self._store.async_load() or {}
+
+    async def async_remove(self) -> None:
+        """Delete the saved selections."""
+        await self._store.async_remove()
+
+    def get(self, vin: str) -> str | None:
+        """Return the preset selected for a vehicle."""
+        return self._presets.get(vin)
+
+    @callback
+    def async_set(self, vin: str, name: str) -> None:
+        """Select a preset for a vehicle and schedule saving it."""
+        if self._presets.get(vin) != name:
+            self._presets[vin] = name
+            self._store.async_delay_save(
+                lambda: dict(self._presets), STORAGE_SAVE_DELAY
+            )
@@ -0,0 +1,41 @@
+"""Vehicle identifiers and capabilities."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class VehicleSchedule:
+    """Times (epoch seconds) of the last vehicle poll and data fetch."""
+
+    last_update: float = 0
+    last_fetch: float = 0
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleInfo:
+    """
+    Identifiers and capabilities of a vehicle, as reported at setup.
+
+    The record is immutable and shared by all of the vehicle's entities. Only
+    the poll and fetch times in `schedule` change, and only in the refresh
+    helpers of remote_service.
+    """
+
+    vin: str
+    model_name: str
+    model_year: str
+    name: str
+    api_gen: str
+    has_ev: bool
+    has_lock_status: bool
+    has_power_windows: bool
+    has_sunroof: bool
+    has_remote_start: bool
+    has_remote_service: bool
+    has_safety_service: bool
+    has_tpms: bool
+    schedule: VehicleSchedule = field(
+        default_factory=VehicleSchedule, compare=False, repr=False
+    )
@@ -0,0 +1,91 @@
+"""
+Measure import and setup time of the Subaru integration.
+
+Usage: python scripts/profile_startup.py [--runs N]
+
+Import time is read from `python -X importtime` in a fresh interpreter for
+each run. Setup time is the duration pytest reports for setting up the EV
+test entry with the MySubaru API mocked. Medians over all runs are printed,
+so results from different releases can be compared on the same machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.subaru"
+SETUP_TEST = "tests/test_init.py::test_setup_ev"
+SETUP_DURATION = re.compile(rf"([\d.]+)s setup\s+{re.escape(SETUP_TEST)}")
+
+
+def import_time() -> tuple[float, list[str]]:
+    """Return import time (ms) of the package and the submodules it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}"],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative = 0.0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        name = name.strip()
+        if name == PACKAGE:
+            cumulative = int(total) / 1000
+        elif name.startswith(f"{PACKAGE}."):
+            modules.append(name)
+    return cumulative, sorted(modules)
+
+
+def setup_time() -> float:
+    """Return the time (ms) pytest spent setting up the EV test entry."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            SETUP_TEST,
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "--no-cov",
+            "--durations=0",
+            "--durations-min=0",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    if not (match := SETUP_DURATION.search(result.stdout)):
+        raise RuntimeError(f"No setup duration reported:\n{result.stdout}")
+    return float(match.group(1)) * 1000
+
+
+def main() -> None:
+    """Run the measurements and print their medians."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    imports = [import_time() for _ in range(args.runs)]
+    setups = [setup_time() for _ in range(args.runs)]
+
+    print(f"{PACKAGE} ({args.runs} runs, median)")
+    print(f"  import: {statistics.median(ms for ms, _ in imports):8.1f} ms")
+    print(f"  setup:  {statistics.median(setups):8.1f} ms")
+    print(f"  modules loaded by import: {', '.join(imports[0][1]) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ from custom_components.subaru.const import (
     VEHICLE_MODEL_NAME,
     VEHICLE_MODEL_YEAR,
     VEHICLE_NAME,
+    VEHICLE_STATUS,
 )
 from custom_components.subaru.options import NotificationOptions, PollingOptions
 from homeassistant import config_entries
@@ -115,6 +116,13 @@ def advance_time(hass, seconds):
     async_fire_time_changed(hass, future)
 
 
+def update_vehicle_status(coordinator, changes, vin=TEST_VIN_2_EV):
+    """Publish new coordinator data with changed status values for a vehicle."""
+    vehicle = dict(coordinator.data[vin])
+    vehicle[VEHICLE_STATUS] = {**vehicle[VEHICLE_STATUS], **changes}
+    coordinator.async_set_updated_data({**coordinator.data, vin: vehicle})
+
+
 # pylint: disable=dangerous-default-value
 # pylint: disable=too-many-positional-arguments
 async def setup_subaru_config_entry(
@@ -1,5 +1,6 @@
 """Test Subaru binary sensors."""
 
+from copy import deepcopy
 from unittest.mock import patch
 
 import pytest
@@ -8,22 +9,27 @@ from custom_components.subaru.binary_sensor import (
     API_GEN_2_BINARY_SENSORS,
     DOMAIN as BINARY_SENSOR_DOMAIN,
     EV_BINARY_SENSORS,
+    TROUBLE_BINARY_SENSOR,
 )
 from custom_components.subaru.const import (
     DOMAIN as SUBARU_DOMAIN,
     FETCH_INTERVAL,
+    VEHICLE_HEALTH,
     VEHICLE_NAME,
 )
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.util import slugify
 
 from .api_responses import (
     EXPECTED_STATE_EV_BINARY_SENSORS,
     EXPECTED_STATE_EV_UNAVAILABLE,
     TEST_VIN_2_EV,
+    VEHICLE_STATUS_EV,
 )
 from .conftest import (
     MOCK_API_FETCH,
     MOCK_API_GET_DATA,
+    TEST_DEVICE_NAME,
     advance_time,
     migrate_unique_ids,
     migrate_unique_ids_duplicate,
@@ -48,6 +54,25 @@ async def test_binary_sensors_missing_vin_data(hass, ev_entry):
     _assert_data(hass, EXPECTED_STATE_EV_UNAVAILABLE)
 
 
+async def test_binary_sensor_trouble_codes(hass, ev_entry):
+    """Test that MIL attributes follow changes to the health data."""
+    entity_id = f"binary_sensor.{slugify(f'{TEST_DEVICE_NAME} {TROUBLE_BINARY_SENSOR[0].name}')}"
+    actual = hass.states.get(entity_id)
+    assert actual.state == STATE_ON
+    assert "WASH_MIL" in actual.attributes
+
+    fixed = deepcopy(VEHICLE_STATUS_EV)
+    fixed[VEHICLE_HEALTH]["ISTROUBLE"] = False
+    fixed[VEHICLE_HEALTH]["FEATURES"]["WASH_MIL"] = {"ISTROUBLE": False, "ONDATE": None}
+    with patch(MOCK_API_FETCH), patch(MOCK_API_GET_DATA, return_value=fixed):
+        advance_time(hass, FETCH_INTERVAL)
+        await hass.async_block_till_done()
+
+    actual = hass.states.get(entity_id)
+    assert actual.state == STATE_OFF
+    assert "WASH_MIL" not in actual.attributes
+
+
 @pytest.mark.parametrize(
     "entitydata,old_unique_id,new_unique_id",
     [
@@ -1,10 +1,12 @@
 """Test Subaru buttons."""
 
+import asyncio
 from unittest.mock import patch
 
 from pytest import raises
 from subarulink import InvalidPIN
 
+from custom_components.subaru.const import CONF_QUEUE_BUTTON_COMMANDS
 from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.exceptions import HomeAssistantError
@@ -23,6 +25,7 @@ REMOTE_LIGHTS_BUTTON = "button.test_vehicle_2_lights_start"
 REMOTE_START_BUTTON = "button.test_vehicle_2_remote_start"
 REMOTE_REFRESH_BUTTON = "button.test_vehicle_2_refresh"
 REMOTE_POLL_VEHICLE_BUTTON = "button.test_vehicle_2_poll_vehicle"
+COMMAND_STATUS_SENSOR = "sensor.test_vehicle_2_command_status"
 
 
 async def test_device_exists(hass, entity_registry: er.EntityRegistry, ev_entry):
@@ -143,3 +146,35 @@ async def test_button_invalid_pin(hass, ev_entry):
             await hass.async_block_till_done()
             mock_horn.assert_called_once()
             mock_fetch.assert_called_once()
+
+
+async def test_button_queued(hass, ev_entry):
+    """Test queued button press returns before the command completes."""
+    hass.config_entries.async_update_entry(
+        ev_entry, options={**ev_entry.options, CONF_QUEUE_BUTTON_COMMANDS: True}
+    )
+    release = asyncio.Event()
+
+    async def slow_lights(vin):
+        await release.wait()
+        return True
+
+    with (
+        patch(MOCK_API_LIGHTS, side_effect=slow_lights) as mock_lights,
+        patch(MOCK_API_FETCH),
+    ):
+        await hass.services.async_call(
+            BUTTON_DOMAIN,
+            "press",
+            {ATTR_ENTITY_ID: REMOTE_LIGHTS_BUTTON},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get(COMMAND_STATUS_SENSOR).state == "running"
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        mock_lights.assert_called_once()
+        state = hass.states.get(COMMAND_STATUS_SENSOR)
+        assert state.state == "success"
+        assert state.attributes["command"] == "lights"
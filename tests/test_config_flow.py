@@ -12,6 +12,7 @@ from custom_components.subaru import config_flow
 from custom_components.subaru.const import (
     CONF_NOTIFICATION_OPTION,
     CONF_POLLING_OPTION,
+    CONF_RATE_LIMIT_CAPACITY,
     DOMAIN,
 )
 from custom_components.subaru.options import NotificationOptions, PollingOptions
@@ -410,7 +411,7 @@ async def test_user_form_pin_not_required(hass, two_factor_verify_form):
         "handler": DOMAIN,
         "type": "create_entry",
         "version": 1,
-        "minor_version": 1,
+        "minor_version": 3,
         "data": deepcopy(TEST_CONFIG),
         "options": {},
         "context": {"source": "user"},
@@ -450,7 +451,7 @@ async def test_pin_form_success(hass, pin_form):
         "handler": DOMAIN,
         "type": "create_entry",
         "version": 1,
-        "minor_version": 1,
+        "minor_version": 3,
         "data": TEST_CONFIG,
         "options": {},
         "context": {"source": "user"},
@@ -497,6 +498,32 @@ async def test_option_flow(hass, options_form):
     }
 
 
+async def test_option_flow_keeps_advanced_options(
+    hass, enable_custom_integrations, mock_entry_with_options
+):
+    """Test saving basic options keeps advanced options that were not shown."""
+    hass.config_entries.async_update_entry(
+        mock_entry_with_options,
+        options={**mock_entry_with_options.options, CONF_RATE_LIMIT_CAPACITY: 3},
+    )
+    options_form = await hass.config_entries.options.async_init(
+        mock_entry_with_options.entry_id
+    )
+    result = await hass.config_entries.options.async_configure(
+        options_form["flow_id"],
+        user_input={
+            CONF_NOTIFICATION_OPTION: NotificationOptions.PENDING.value,
+            CONF_POLLING_OPTION: PollingOptions.DISABLE.value,
+        },
+    )
+    assert result["type"] == "create_entry"
+    assert result["data"] == {
+        CONF_NOTIFICATION_OPTION: NotificationOptions.PENDING.value,
+        CONF_POLLING_OPTION: PollingOptions.DISABLE.value,
+        CONF_RATE_LIMIT_CAPACITY: 3,
+    }
+
+
 async def test_pin_form_update_pin_returns_false(hass, pin_form):
     """Test PIN form when update_saved_pin returns False - no PIN validation occurs."""
     with patch(
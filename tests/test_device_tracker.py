@@ -1,6 +1,7 @@
 """Test Subaru device tracker."""
 
 from copy import deepcopy
+import datetime
 from unittest.mock import patch
 
 from subarulink.const import (
@@ -11,6 +12,7 @@ from subarulink.const import (
     VEHICLE_STATUS,
 )
 
+from custom_components.subaru.const import CONF_TRACKER_MOVEMENT_THRESHOLD
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
@@ -61,3 +63,31 @@ async def test_device_tracker_missing_data(hass: HomeAssistant, ev_entry) -> Non
     actual = hass.states.get(DEVICE_ID)
     assert not actual.attributes.get(ATTR_LATITUDE)
     assert not actual.attributes.get(ATTR_LONGITUDE)
+
+
+async def test_device_tracker_movement_threshold(hass: HomeAssistant, ev_entry) -> None:
+    """Test that position changes within the movement threshold are ignored."""
+    hass.config_entries.async_update_entry(
+        ev_entry, options={**ev_entry.options, CONF_TRACKER_MOVEMENT_THRESHOLD: 50}
+    )
+    initial = hass.states.get(DEVICE_ID)
+
+    jitter = deepcopy(VEHICLE_STATUS_EV)
+    jitter[VEHICLE_STATUS][LATITUDE] += 0.0001
+    jitter[VEHICLE_STATUS][TIMESTAMP] += datetime.timedelta(hours=1)
+    with patch(MOCK_API_FETCH), patch(MOCK_API_GET_DATA, return_value=jitter):
+        advance_time(hass, FETCH_INTERVAL)
+        await hass.async_block_till_done()
+
+    actual = hass.states.get(DEVICE_ID)
+    assert actual.attributes == initial.attributes
+    assert actual.last_updated == initial.last_updated
+
+    moved = deepcopy(jitter)
+    moved[VEHICLE_STATUS][LATITUDE] += 0.01
+    with patch(MOCK_API_FETCH), patch(MOCK_API_GET_DATA, return_value=moved):
+        advance_time(hass, 2 * FETCH_INTERVAL)
+        await hass.async_block_till_done()
+
+    actual = hass.states.get(DEVICE_ID)
+    assert actual.attributes.get(ATTR_LATITUDE) == moved[VEHICLE_STATUS][LATITUDE]
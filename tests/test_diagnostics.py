@@ -32,6 +32,13 @@ async def test_config_entry_diagnostics(hass: HomeAssistant, ev_entry):
     expected = json.loads(load_fixture("diagnostics_config_entry.json"))
 
     result = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    # Rate limiter level depends on elapsed time, so check it separately
+    rate_limiter = result.pop("rate_limiter")
+    assert rate_limiter["calls"] > 0
+    assert 0 <= rate_limiter["tokens"] <= rate_limiter["capacity"]
+    assert rate_limiter["waits"] == 0
+
     assert json.dumps(expected) == json.dumps(result, default=str)
 
 
@@ -2,15 +2,42 @@
 
 from unittest.mock import patch
 
+from pytest import raises
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 from subarulink import InvalidCredentials, SubaruException
+import subarulink.const as sc
 
-from custom_components.subaru.const import DOMAIN, UPDATE_INTERVAL_CHARGING
+from custom_components.subaru import _async_startup_delay, async_migrate_entry
+from custom_components.subaru.const import (
+    ATTR_COMMAND,
+    ATTR_COMMANDS,
+    CONF_COMMAND_TIMEOUT,
+    CONF_COMMAND_TIMEOUT_LOCK,
+    CONF_COMMAND_TIMEOUT_OTHER,
+    CONF_COMMAND_TIMEOUT_REMOTE_START,
+    DATA_RATE_LIMITERS,
+    DOMAIN,
+    ENTRY_RATE_LIMITER,
+    EVENT_SUBARU_COMMANDS_FINISHED,
+    SERVICE_RUN_COMMANDS,
+    STARTUP_JITTER,
+    STARTUP_STAGGER,
+    UPDATE_INTERVAL_CHARGING,
+    VEHICLE_STATUS,
+)
+from custom_components.subaru.device import _DEVICE_INFO
 from homeassistant.components.homeassistant import (
     DOMAIN as HA_DOMAIN,
     SERVICE_UPDATE_ENTITY,
 )
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON
+from homeassistant.const import ATTR_ENTITY_ID, CONF_DEVICE_ID, STATE_OFF, STATE_ON
+from homeassistant.core import CoreState
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
 from homeassistant.setup import async_setup_component
 
 from .api_responses import (
@@ -24,9 +51,13 @@ from .api_responses import (
 from .conftest import (
     MOCK_API_FETCH,
     MOCK_API_GET_DATA,
+    MOCK_API_LIGHTS,
+    MOCK_API_REMOTE_START,
     MOCK_API_UPDATE,
+    TEST_CONFIG_ENTRY,
     TEST_ENTITY_ID,
     advance_time,
+    setup_default_ev_entry,
     setup_subaru_config_entry,
 )
 
@@ -45,6 +76,74 @@ async def test_setup_ev(hass, ev_entry):
     assert check_entry.state is ConfigEntryState.LOADED
 
 
+async def test_setup_migrates_entry(hass, ev_entry):
+    """Test entity migration runs once and records the new minor version."""
+    assert ev_entry.version == 1
+    assert ev_entry.minor_version == 3
+
+    with patch(
+        "custom_components.subaru.migrate.async_migrate_entries"
+    ) as mock_migrate:
+        assert await async_migrate_entry(hass, ev_entry)
+    mock_migrate.assert_not_called()
+
+
+async def test_migrate_command_timeout(hass, enable_custom_integrations):
+    """Test the single command time limit becomes the limit of every group."""
+    entry = MockConfigEntry(
+        **{**TEST_CONFIG_ENTRY, "options": {CONF_COMMAND_TIMEOUT: 45}},
+        minor_version=2,
+    )
+    entry.add_to_hass(hass)
+
+    assert await async_migrate_entry(hass, entry)
+    assert entry.minor_version == 3
+    assert entry.options == {
+        CONF_COMMAND_TIMEOUT_LOCK: 45,
+        CONF_COMMAND_TIMEOUT_REMOTE_START: 45,
+        CONF_COMMAND_TIMEOUT_OTHER: 45,
+    }
+
+
+async def test_startup_delay(hass, subaru_config_entry):
+    """Test first refreshes of several entries are staggered during boot."""
+    second_entry = MockConfigEntry(**{**TEST_CONFIG_ENTRY, "entry_id": "2"})
+    second_entry.add_to_hass(hass)
+    assert _async_startup_delay(hass, subaru_config_entry) == 0
+    assert _async_startup_delay(hass, second_entry) == 0
+
+    hass.set_state(CoreState.not_running)
+    try:
+        assert _async_startup_delay(hass, subaru_config_entry) == 0
+        delay = _async_startup_delay(hass, second_entry)
+        assert STARTUP_STAGGER <= delay <= STARTUP_STAGGER + STARTUP_JITTER
+    finally:
+        hass.set_state(CoreState.running)
+
+
+async def test_setup_delays_first_refresh(
+    hass, subaru_config_entry, enable_custom_integrations
+):
+    """Test a delayed entry loads at once and refreshes when its delay passes."""
+    with (
+        patch("custom_components.subaru._async_startup_delay", return_value=10),
+        patch(MOCK_API_FETCH) as mock_fetch,
+    ):
+        await setup_default_ev_entry(hass, subaru_config_entry)
+        assert subaru_config_entry.state is ConfigEntryState.LOADED
+        mock_fetch.assert_not_called()
+        assert hass.states.get(TEST_ENTITY_ID).state == "unavailable"
+
+        with (
+            patch(MOCK_API_UPDATE),
+            patch(MOCK_API_GET_DATA, return_value=VEHICLE_STATUS_EV),
+        ):
+            advance_time(hass, 10)
+            await hass.async_block_till_done()
+        mock_fetch.assert_called_once()
+    assert hass.states.get(TEST_ENTITY_ID).state != "unavailable"
+
+
 async def test_setup_g3(hass, subaru_config_entry, enable_custom_integrations):
     """Test setup with a G3 vehicle ."""
     await setup_subaru_config_entry(
@@ -166,6 +265,24 @@ async def test_unload_entry(hass, ev_entry):
     assert await hass.config_entries.async_unload(ev_entry.entry_id)
     await hass.async_block_till_done()
     assert ev_entry.state is ConfigEntryState.NOT_LOADED
+    assert not _DEVICE_INFO
+
+
+async def test_reload_keeps_rate_limiter(hass, ev_entry):
+    """Test that setup API calls are throttled by a limiter kept across reloads."""
+    rate_limiter = hass.data[DOMAIN][ev_entry.entry_id][ENTRY_RATE_LIMITER]
+    calls = rate_limiter.calls
+    assert calls >= 3
+
+    assert await hass.config_entries.async_unload(ev_entry.entry_id)
+    await setup_default_ev_entry(hass, ev_entry)
+    assert ev_entry.state is ConfigEntryState.LOADED
+    assert hass.data[DOMAIN][ev_entry.entry_id][ENTRY_RATE_LIMITER] is rate_limiter
+    assert rate_limiter.calls >= 2 * calls
+
+    assert await hass.config_entries.async_remove(ev_entry.entry_id)
+    await hass.async_block_till_done()
+    assert ev_entry.entry_id not in hass.data[DATA_RATE_LIMITERS]
 
 
 async def test_charging_polling(hass, ev_entry_charge_polling):
@@ -196,3 +313,70 @@ async def test_charging_polling(hass, ev_entry_charge_polling):
         advance_time(hass, UPDATE_INTERVAL_CHARGING)
         await hass.async_block_till_done()
         mock_update.assert_called_once()
+
+
+async def test_run_commands(hass, device_registry: dr.DeviceRegistry, ev_entry):
+    """Test commands run in order with one event and one refresh."""
+    device = device_registry.async_get_device(identifiers={(DOMAIN, TEST_VIN_2_EV)})
+    events = async_capture_events(hass, EVENT_SUBARU_COMMANDS_FINISHED)
+    odometer = hass.states.get("sensor.test_vehicle_2_odometer").state
+    status = VEHICLE_STATUS_EV[VEHICLE_STATUS]
+    fresh = {
+        **VEHICLE_STATUS_EV,
+        VEHICLE_STATUS: {**status, sc.ODOMETER: status[sc.ODOMETER] + 100},
+    }
+    with (
+        patch(MOCK_API_LIGHTS, return_value=True) as mock_lights,
+        patch(MOCK_API_REMOTE_START, return_value=True) as mock_remote_start,
+        patch(MOCK_API_FETCH) as mock_fetch,
+        patch(MOCK_API_GET_DATA, return_value=fresh),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_RUN_COMMANDS,
+            {
+                CONF_DEVICE_ID: device.id,
+                ATTR_COMMANDS: [
+                    {ATTR_COMMAND: "lights"},
+                    {ATTR_COMMAND: "remote_start"},
+                ],
+            },
+            blocking=True,
+        )
+        mock_lights.assert_called_once()
+        mock_remote_start.assert_called_once()
+        mock_fetch.assert_called_once()
+    assert len(events) == 1
+    assert events[0].data["success"]
+    assert events[0].data["completed"] == ["lights", "remote_start"]
+    assert hass.states.get("sensor.test_vehicle_2_odometer").state != odometer
+
+
+async def test_run_commands_stops_at_failure(
+    hass, device_registry: dr.DeviceRegistry, ev_entry
+):
+    """Test remaining commands are not sent after a failure."""
+    device = device_registry.async_get_device(identifiers={(DOMAIN, TEST_VIN_2_EV)})
+    events = async_capture_events(hass, EVENT_SUBARU_COMMANDS_FINISHED)
+    with (
+        patch(MOCK_API_LIGHTS, return_value=False),
+        patch(MOCK_API_REMOTE_START) as mock_remote_start,
+        patch(MOCK_API_FETCH) as mock_fetch,
+    ):
+        with raises(HomeAssistantError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_RUN_COMMANDS,
+                {
+                    CONF_DEVICE_ID: device.id,
+                    ATTR_COMMANDS: [
+                        {ATTR_COMMAND: "lights"},
+                        {ATTR_COMMAND: "remote_start"},
+                    ],
+                },
+                blocking=True,
+            )
+        mock_remote_start.assert_not_called()
+        mock_fetch.assert_called_once()
+    assert len(events) == 1
+    assert events[0].data["failed_command"] == "lights"
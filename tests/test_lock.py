@@ -1,31 +1,44 @@
 """Test Subaru locks."""
 
+import asyncio
 from unittest.mock import patch
 
 from pytest import raises
+from pytest_homeassistant_custom_component.common import async_capture_events
 from subarulink.const import (
     LOCK_BOOT_STATUS,
     LOCK_FRONT_LEFT_STATUS,
     LOCK_FRONT_RIGHT_STATUS,
     LOCK_REAR_LEFT_STATUS,
     LOCK_REAR_RIGHT_STATUS,
+    ODOMETER,
 )
 
 from custom_components.subaru.const import (
     ATTR_DOOR,
+    CONF_COMMAND_TIMEOUT_LOCK,
+    CONF_COMMAND_TIMEOUT_REMOTE_START,
+    CONF_SKIP_REDUNDANT_COMMANDS,
     DOMAIN as SUBARU_DOMAIN,
     ENTRY_COORDINATOR,
+    EVENT_SUBARU_COMMAND_SUCCESS,
+    REMOTE_SERVICE_HORN,
+    REMOTE_SERVICE_LOCK,
+    REMOTE_SERVICE_REMOTE_START,
+    REMOTE_SERVICE_REMOTE_STOP,
+    REMOTE_SERVICE_UNLOCK,
     SERVICE_UNLOCK_SPECIFIC_DOOR,
     UNLOCK_DOOR_DRIVERS,
     VEHICLE_STATUS,
 )
+from custom_components.subaru.remote_service import get_command_timeout
 from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN
 from homeassistant.const import ATTR_ENTITY_ID, SERVICE_LOCK, SERVICE_UNLOCK
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 
-from .api_responses import TEST_VIN_2_EV
-from .conftest import MOCK_API
+from .api_responses import TEST_VIN_2_EV, VEHICLE_STATUS_EV
+from .conftest import MOCK_API, MOCK_API_GET_DATA, update_vehicle_status
 
 MOCK_API_FETCH = f"{MOCK_API}fetch"
 MOCK_API_LOCK = f"{MOCK_API}lock"
@@ -61,6 +74,28 @@ async def test_unlock(hass, ev_entry):
         mock_fetch.assert_called_once()
 
 
+async def test_lock_updates_vehicle_entities(hass, ev_entry):
+    """Test data fetched after a lock command reaches the vehicle's other entities."""
+    odometer = "sensor.test_vehicle_2_odometer"
+    initial = hass.states.get(odometer).state
+    status = VEHICLE_STATUS_EV[VEHICLE_STATUS]
+    fresh = {
+        **VEHICLE_STATUS_EV,
+        VEHICLE_STATUS: {**status, ODOMETER: status[ODOMETER] + 100},
+    }
+    with (
+        patch(MOCK_API_LOCK),
+        patch(MOCK_API_FETCH),
+        patch(MOCK_API_GET_DATA, return_value=fresh),
+    ):
+        await hass.services.async_call(
+            LOCK_DOMAIN, SERVICE_LOCK, {ATTR_ENTITY_ID: DEVICE_ID}, blocking=True
+        )
+        await hass.async_block_till_done()
+
+    assert hass.states.get(odometer).state != initial
+
+
 async def test_unlock_specific_door(hass, ev_entry):
     """Test subaru unlock specific door function."""
     with patch(MOCK_API_UNLOCK) as mock_unlock, patch(MOCK_API_FETCH) as mock_fetch:
@@ -75,6 +110,93 @@ async def test_unlock_specific_door(hass, ev_entry):
         mock_fetch.assert_called_once()
 
 
+async def test_unlock_specific_door_response(hass, ev_entry):
+    """Test unlock specific door returns each vehicle's result."""
+    with (
+        patch(MOCK_API_UNLOCK, return_value=False) as mock_unlock,
+        patch(MOCK_API_FETCH) as mock_fetch,
+    ):
+        response = await hass.services.async_call(
+            SUBARU_DOMAIN,
+            SERVICE_UNLOCK_SPECIFIC_DOOR,
+            {ATTR_ENTITY_ID: DEVICE_ID, ATTR_DOOR: UNLOCK_DOOR_DRIVERS},
+            blocking=True,
+            return_response=True,
+        )
+        await hass.async_block_till_done()
+        mock_unlock.assert_called_once()
+        mock_fetch.assert_not_called()
+    assert response[DEVICE_ID]["success"] is False
+    assert response[DEVICE_ID]["vehicle"] == "test_vehicle_2"
+
+
+async def test_unlock_specific_door_response_refreshes(hass, ev_entry):
+    """Test a completed unlock is followed by the grouped refresh."""
+    with (
+        patch(MOCK_API_UNLOCK, return_value=True) as mock_unlock,
+        patch(MOCK_API_FETCH) as mock_fetch,
+        patch(MOCK_API_GET_DATA, return_value=VEHICLE_STATUS_EV) as mock_get_data,
+    ):
+        response = await hass.services.async_call(
+            SUBARU_DOMAIN,
+            SERVICE_UNLOCK_SPECIFIC_DOOR,
+            {ATTR_ENTITY_ID: DEVICE_ID, ATTR_DOOR: UNLOCK_DOOR_DRIVERS},
+            blocking=True,
+            return_response=True,
+        )
+        await hass.async_block_till_done()
+        mock_unlock.assert_called_once()
+        mock_fetch.assert_called_once()
+        mock_get_data.assert_called_once_with(TEST_VIN_2_EV)
+    assert response[DEVICE_ID]["success"] is True
+
+
+async def test_lock_timeout_completes_in_background(hass, ev_entry):
+    """Test a slow lock command returns early and reports its result later."""
+    hass.config_entries.async_update_entry(
+        ev_entry, options={**ev_entry.options, CONF_COMMAND_TIMEOUT_LOCK: 0.05}
+    )
+    release = asyncio.Event()
+
+    async def slow_lock(vin):
+        await release.wait()
+        return True
+
+    events = async_capture_events(hass, EVENT_SUBARU_COMMAND_SUCCESS)
+    with patch(MOCK_API_LOCK, side_effect=slow_lock), patch(MOCK_API_FETCH):
+        await hass.services.async_call(
+            LOCK_DOMAIN, SERVICE_LOCK, {ATTR_ENTITY_ID: DEVICE_ID}, blocking=True
+        )
+        assert not events
+        assert hass.states.get(DEVICE_ID).state != "locking"
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert len(events) == 1
+
+
+async def test_command_timeout_groups(hass, ev_entry):
+    """Test each command group's time limit falls back to the command's default."""
+    hass.config_entries.async_update_entry(
+        ev_entry,
+        options={
+            **ev_entry.options,
+            CONF_COMMAND_TIMEOUT_LOCK: 10,
+            CONF_COMMAND_TIMEOUT_REMOTE_START: 0,
+        },
+    )
+    assert get_command_timeout(ev_entry, REMOTE_SERVICE_LOCK) == 10
+    assert get_command_timeout(ev_entry, REMOTE_SERVICE_UNLOCK) == 10
+    assert get_command_timeout(ev_entry, REMOTE_SERVICE_REMOTE_START) == 0
+    assert get_command_timeout(ev_entry, REMOTE_SERVICE_REMOTE_STOP) == 0
+    assert get_command_timeout(ev_entry, REMOTE_SERVICE_HORN) == 30
+
+    hass.config_entries.async_update_entry(
+        ev_entry, options={**ev_entry.options, CONF_COMMAND_TIMEOUT_REMOTE_START: None}
+    )
+    assert get_command_timeout(ev_entry, REMOTE_SERVICE_REMOTE_START) == 60
+
+
 async def test_lock_failed(hass, ev_entry):
     """Test subaru lock failure path raises HomeAssistantError."""
     with (
@@ -120,13 +242,22 @@ async def test_unlock_specific_door_failed(hass, ev_entry):
             )
             await hass.async_block_till_done()
         mock_unlock.assert_called_once()
-        mock_fetch.assert_called_once()
+        mock_fetch.assert_not_called()
+
+
+async def test_unlock_specific_door_removed_on_unload(hass, ev_entry):
+    """Test the unlock_specific_door service is removed with the last entry."""
+    assert hass.services.has_service(SUBARU_DOMAIN, SERVICE_UNLOCK_SPECIFIC_DOOR)
+    assert await hass.config_entries.async_unload(ev_entry.entry_id)
+    await hass.async_block_till_done()
+    assert not hass.services.has_service(SUBARU_DOMAIN, SERVICE_UNLOCK_SPECIFIC_DOOR)
 
 
 async def test_is_locked_vin_absent_from_coordinator(hass, ev_entry):
     """Test is_locked returns None when VIN is absent from coordinator data."""
     coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
     coordinator.data.pop(TEST_VIN_2_EV, None)
+    coordinator.async_set_updated_data(coordinator.data)
 
     lock_entity = hass.data["entity_components"][LOCK_DOMAIN].get_entity(DEVICE_ID)
     assert lock_entity is not None
@@ -137,6 +268,7 @@ async def test_extra_state_attributes_vin_absent_from_coordinator(hass, ev_entry
     """Test extra_state_attributes returns None when VIN is absent from coordinator data."""
     coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
     coordinator.data.pop(TEST_VIN_2_EV, None)
+    coordinator.async_set_updated_data(coordinator.data)
 
     lock_entity = hass.data["entity_components"][LOCK_DOMAIN].get_entity(DEVICE_ID)
     assert lock_entity is not None
@@ -155,9 +287,7 @@ ALL_LOCK_DOORS = [
 async def test_is_locked_all_doors_locked(hass, ev_entry):
     """Test is_locked is True when the vehicle reports every door locked."""
     coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
-    status = coordinator.data[TEST_VIN_2_EV][VEHICLE_STATUS]
-    for door in ALL_LOCK_DOORS:
-        status[door] = "LOCKED"
+    update_vehicle_status(coordinator, dict.fromkeys(ALL_LOCK_DOORS, "LOCKED"))
 
     lock_entity = hass.data["entity_components"][LOCK_DOMAIN].get_entity(DEVICE_ID)
     assert lock_entity is not None
@@ -167,10 +297,10 @@ async def test_is_locked_all_doors_locked(hass, ev_entry):
 async def test_is_locked_one_door_unlocked(hass, ev_entry):
     """Test is_locked is False when any single door is reported unlocked."""
     coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
-    status = coordinator.data[TEST_VIN_2_EV][VEHICLE_STATUS]
-    for door in ALL_LOCK_DOORS:
-        status[door] = "LOCKED"
-    status[LOCK_BOOT_STATUS] = "UNLOCKED"
+    update_vehicle_status(
+        coordinator,
+        {**dict.fromkeys(ALL_LOCK_DOORS, "LOCKED"), LOCK_BOOT_STATUS: "UNLOCKED"},
+    )
 
     lock_entity = hass.data["entity_components"][LOCK_DOMAIN].get_entity(DEVICE_ID)
     assert lock_entity is not None
@@ -185,15 +315,30 @@ async def test_lock_state_follows_coordinator_update(hass, ev_entry):
     rather than remaining stuck at its initial state.
     """
     coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
-    status = coordinator.data[TEST_VIN_2_EV][VEHICLE_STATUS]
-    for door in ALL_LOCK_DOORS:
-        status[door] = "LOCKED"
-
-    coordinator.async_set_updated_data(coordinator.data)
+    update_vehicle_status(coordinator, dict.fromkeys(ALL_LOCK_DOORS, "LOCKED"))
     await hass.async_block_till_done()
     assert hass.states.get(DEVICE_ID).state == "locked"
 
-    status[LOCK_FRONT_LEFT_STATUS] = "UNLOCKED"
-    coordinator.async_set_updated_data(coordinator.data)
+    update_vehicle_status(coordinator, {LOCK_FRONT_LEFT_STATUS: "UNLOCKED"})
     await hass.async_block_till_done()
     assert hass.states.get(DEVICE_ID).state == "unlocked"
+
+
+async def test_lock_skipped_when_already_locked(hass, ev_entry):
+    """Test lock command is not sent when fresh data shows all doors locked."""
+    hass.config_entries.async_update_entry(
+        ev_entry, options={**ev_entry.options, CONF_SKIP_REDUNDANT_COMMANDS: True}
+    )
+    coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
+    update_vehicle_status(coordinator, dict.fromkeys(ALL_LOCK_DOORS, "LOCKED"))
+
+    events = async_capture_events(hass, EVENT_SUBARU_COMMAND_SUCCESS)
+    with patch(MOCK_API_LOCK) as mock_lock, patch(MOCK_API_FETCH) as mock_fetch:
+        await hass.services.async_call(
+            LOCK_DOMAIN, SERVICE_LOCK, {ATTR_ENTITY_ID: DEVICE_ID}, blocking=True
+        )
+        await hass.async_block_till_done()
+        mock_lock.assert_not_called()
+        mock_fetch.assert_not_called()
+    assert len(events) == 1
+    assert events[0].data["skipped"] is True
@@ -0,0 +1,41 @@
+"""Test Subaru API rate limiter."""
+
+from unittest.mock import patch
+
+from custom_components.subaru.rate_limiter import RateLimiter
+
+MOCK_SLEEP = "custom_components.subaru.rate_limiter.asyncio.sleep"
+
+
+async def test_burst_within_capacity() -> None:
+    """Test calls within bucket capacity do not wait."""
+    rate_limiter = RateLimiter(3, 60)
+    with patch(MOCK_SLEEP) as mock_sleep:
+        for _ in range(3):
+            await rate_limiter.async_acquire()
+        mock_sleep.assert_not_called()
+    assert rate_limiter.calls == 3
+    assert rate_limiter.waits == 0
+    assert rate_limiter.tokens < 1
+
+
+async def test_wait_when_empty() -> None:
+    """Test a call waits for a token once the bucket is empty."""
+    rate_limiter = RateLimiter(1, 60)
+    with patch(MOCK_SLEEP) as mock_sleep:
+        await rate_limiter.async_acquire()
+        await rate_limiter.async_acquire()
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 60
+    diagnostics = rate_limiter.as_dict()
+    assert diagnostics["calls"] == 2
+    assert diagnostics["waits"] == 1
+    assert diagnostics["last_wait_time"] > 0
+
+
+async def test_set_limits() -> None:
+    """Test changing limits caps the current level to the new capacity."""
+    rate_limiter = RateLimiter(10, 60)
+    rate_limiter.set_limits(2, 30)
+    assert rate_limiter.tokens <= 2
+    assert rate_limiter.as_dict()["refill_seconds"] == 30
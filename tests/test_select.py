@@ -2,14 +2,24 @@
 
 import pytest
 
-from custom_components.subaru.const import DOMAIN as SUBARU_DOMAIN
+from custom_components.subaru.const import (
+    DOMAIN as SUBARU_DOMAIN,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
 from custom_components.subaru.select import CLIMATE_SELECT, OLD_CLIMATE_SELECT
 from homeassistant.components.select import DOMAIN as SELECT_DOMAIN
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_OPTION, SERVICE_SELECT_OPTION
 from homeassistant.helpers import entity_registry as er
 
 from .api_responses import TEST_VIN_2_EV
-from .conftest import migrate_unique_ids, migrate_unique_ids_duplicate
+from .conftest import (
+    advance_time,
+    migrate_unique_ids,
+    migrate_unique_ids_duplicate,
+    setup_default_ev_entry,
+)
 
 DEVICE_ID = "select.test_vehicle_2_climate_preset"
 
@@ -33,6 +43,28 @@ async def test_select(hass, ev_entry_with_saved_climate):
     assert hass.states.get(DEVICE_ID).state == "Full Heat"
 
 
+async def test_select_stored(hass, hass_storage, subaru_config_entry):
+    """Test the selected climate preset is stored and restored from storage."""
+    key = STORAGE_KEY.format(subaru_config_entry.entry_id)
+    hass_storage[key] = {
+        "version": STORAGE_VERSION,
+        "key": key,
+        "data": {TEST_VIN_2_EV: "Full Cool"},
+    }
+    await setup_default_ev_entry(hass, subaru_config_entry)
+    assert hass.states.get(DEVICE_ID).state == "Full Cool"
+
+    await hass.services.async_call(
+        SELECT_DOMAIN,
+        SERVICE_SELECT_OPTION,
+        {ATTR_ENTITY_ID: DEVICE_ID, ATTR_OPTION: "Full Heat"},
+        blocking=True,
+    )
+    advance_time(hass, STORAGE_SAVE_DELAY)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"] == {TEST_VIN_2_EV: "Full Heat"}
+
+
 @pytest.mark.parametrize(
     "entitydata,old_unique_id,new_unique_id",
     [
@@ -4,8 +4,15 @@ from typing import Any
 from unittest.mock import patch
 
 import pytest
-
-from custom_components.subaru.const import FETCH_INTERVAL
+import subarulink.const as sc
+
+from custom_components.subaru.const import (
+    CONF_DEADBAND_TIRE_PRESSURE,
+    CONF_STATE_WRITE_INTERVAL,
+    ENTRY_COORDINATOR,
+    FETCH_INTERVAL,
+    VEHICLE_STATUS,
+)
 from custom_components.subaru.sensor import (
     API_GEN_2_SENSORS,
     DOMAIN as SUBARU_DOMAIN,
@@ -13,6 +20,7 @@ from custom_components.subaru.sensor import (
     SAFETY_SENSORS,
 )
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.const import STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
@@ -25,6 +33,7 @@ from .conftest import (
     MOCK_API_GET_DATA,
     advance_time,
     setup_subaru_config_entry,
+    update_vehicle_status,
 )
 
 
@@ -41,6 +50,110 @@ async def test_sensors_missing_vin_data(hass: HomeAssistant, ev_entry) -> None:
     _assert_data(hass, EXPECTED_STATE_EV_UNAVAILABLE)
 
 
+async def test_sensor_invalid_value_dropped(hass: HomeAssistant, ev_entry) -> None:
+    """Test invalid readings are removed before they reach the sensor."""
+    coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
+    update_vehicle_status(
+        coordinator, {sc.AVG_FUEL_CONSUMPTION: sc.BAD_AVG_FUEL_CONSUMPTION}
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test_vehicle_2_average_fuel_consumption")
+    assert state.state == STATE_UNKNOWN
+
+
+async def test_sensor_state_write_interval(hass: HomeAssistant, ev_entry) -> None:
+    """Test updates within the write interval are merged into one later write."""
+    hass.config_entries.async_update_entry(
+        ev_entry,
+        options={
+            **ev_entry.options,
+            CONF_STATE_WRITE_INTERVAL.format(SENSOR_DOMAIN): 60,
+        },
+    )
+    entity_id = "sensor.test_vehicle_2_odometer"
+    initial = hass.states.get(entity_id)
+    coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
+    odometer = coordinator.data[TEST_VIN_2_EV][VEHICLE_STATUS][sc.ODOMETER]
+    for change in (1, 2):
+        update_vehicle_status(coordinator, {sc.ODOMETER: odometer + change})
+        await hass.async_block_till_done()
+        assert hass.states.get(entity_id).last_updated == initial.last_updated
+
+    advance_time(hass, 60)
+    await hass.async_block_till_done()
+
+    actual = hass.states.get(entity_id)
+    assert actual.last_updated != initial.last_updated
+    assert actual.state != initial.state
+
+
+async def test_sensor_deadband(hass: HomeAssistant, ev_entry) -> None:
+    """Test small changes of a noisy sensor do not change its state."""
+    entity_id = "sensor.test_vehicle_2_tire_pressure_front_right"
+    initial = hass.states.get(entity_id)
+    coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
+    exact = coordinator.data[TEST_VIN_2_EV][VEHICLE_STATUS][sc.TIRE_PRESSURE_FR] + 0.2
+    update_vehicle_status(coordinator, {sc.TIRE_PRESSURE_FR: exact})
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == initial.state
+    assert coordinator.data[TEST_VIN_2_EV][VEHICLE_STATUS][sc.TIRE_PRESSURE_FR] == exact
+
+    update_vehicle_status(coordinator, {sc.TIRE_PRESSURE_FR: exact + 1})
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state != initial.state
+
+
+async def test_sensor_deadband_option(hass: HomeAssistant, ev_entry) -> None:
+    """Test a deadband option of 0 reports every rounded change."""
+    hass.config_entries.async_update_entry(
+        ev_entry, options={**ev_entry.options, CONF_DEADBAND_TIRE_PRESSURE: 0}
+    )
+    entity_id = "sensor.test_vehicle_2_tire_pressure_front_right"
+    initial = hass.states.get(entity_id)
+    coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
+    exact = coordinator.data[TEST_VIN_2_EV][VEHICLE_STATUS][sc.TIRE_PRESSURE_FR] + 0.2
+    update_vehicle_status(coordinator, {sc.TIRE_PRESSURE_FR: exact})
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state != initial.state
+
+
+async def test_sensor_added_when_reported(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry, ev_entry
+) -> None:
+    """Test a sensor is only created once the vehicle reports its value."""
+    unique_id = f"{TEST_VIN_2_EV}_{sc.TIRE_PRESSURE_RR}"
+    assert not entity_registry.async_get_entity_id(
+        SENSOR_DOMAIN, SUBARU_DOMAIN, unique_id
+    )
+
+    coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
+    update_vehicle_status(coordinator, {sc.TIRE_PRESSURE_RR: 32.0})
+    await hass.async_block_till_done()
+
+    entity_id = entity_registry.async_get_entity_id(
+        SENSOR_DOMAIN, SUBARU_DOMAIN, unique_id
+    )
+    assert entity_id
+    assert hass.states.get(entity_id).state != STATE_UNKNOWN
+
+
+async def test_sensor_not_added_without_vehicle_data(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry, ev_entry
+) -> None:
+    """Test an update missing the vehicle does not add held back sensors."""
+    coordinator = hass.data[SUBARU_DOMAIN][ev_entry.entry_id][ENTRY_COORDINATOR]
+    coordinator.async_set_updated_data({})
+    await hass.async_block_till_done()
+
+    assert not entity_registry.async_get_entity_id(
+        SENSOR_DOMAIN, SUBARU_DOMAIN, f"{TEST_VIN_2_EV}_{sc.TIRE_PRESSURE_RR}"
+    )
+
+
 @pytest.mark.parametrize(
     ("entitydata", "old_unique_id", "new_unique_id"),
     [